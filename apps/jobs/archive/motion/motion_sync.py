@@ -6,7 +6,8 @@ Bidirectional sync between Motion AI and Notion task databases.
 Handles task creation, updates, and field mapping between systems.
 
 Usage:
-    python motion_sync.py --mode [full|test|test-real]
+    python motion_sync.py --mode [full|incremental|test|test-real]
+    python motion_sync.py --mode incremental --since-hours 24
 
 Environment Variables Required:
     MOTION_API_KEY - Motion AI API token
@@ -24,20 +25,429 @@ Environment Variables Required:
     Examples:
     LIVEPEER_NOTION_API_KEY, LIVEPEER_NOTION_DB_ID, LIVEPEER_NOTION_USER_ID, MOTION_LIVEPEER_WORKSPACE_ID
     VANQUISH_NOTION_API_KEY, VANQUISH_NOTION_DB_ID, VANQUISH_NOTION_USER_ID, MOTION_VANQUISH_WORKSPACE_ID
+
+Optional:
+    MOTION_SYNC_STATE_PATH - Sync state file (default: ~/.motion_notion_sync_state.json)
+    MOTION_RATE_LIMIT - Max Motion API requests per minute (default: 12)
+    SYNC_MAX_WORKERS - Tasks processed concurrently per sync direction (default: 4)
 """
 
 import argparse
+import collections
+import hashlib
 import json
 import logging
 import os
+import random
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import quote
 
+import httpx
 import requests
 from dotenv import load_dotenv
-from notion_client import Client
+from notion_client import APIErrorCode, APIResponseError, Client
+from notion_client.helpers import collect_paginated_api
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+except ImportError:  # optional; Notion calls fall back to HTTP/1.1
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+
+def _json_dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (
+            orjson.OPT_SORT_KEYS if sort_keys else 0
+        )
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Motion custom field IDs (tied to specific workspaces)
+# TODO: These should be moved to environment variables for full dynamic configuration
+MOTION_CUSTOM_FIELDS = {
+    "Hub": {
+        "notion_id": "cfi_4G15DQNV797KHaNzQqsxt3",
+        "notion_url": "cfi_RBFEnK3uN2Ho2o8XQXdWfv",
+        "notion_last_sync": "cfi_U1o2VDha6sjs3UFwFH8xC1",  # text type
+    },
+    # Keep backwards compatibility
+    "Personal": {
+        "notion_id": "cfi_4G15DQNV797KHaNzQqsxt3",
+        "notion_url": "cfi_RBFEnK3uN2Ho2o8XQXdWfv",
+        "notion_last_sync": "cfi_U1o2VDha6sjs3UFwFH8xC1",  # text type
+    },
+    "LIVEPEER": {
+        "notion_id": "cfi_rLcNg95UQ1Cggz2YAnYjsL",
+        "notion_url": "cfi_g85FVuj115igtCPLVCo34t",
+        "notion_last_sync": "cfi_1S1Fi4oP3adjT9Ab88U2Ja",  # date type
+    },
+    "VANQUISH": {
+        "notion_id": "cfi_vS8mS9agZUaCDMX88usZXq",
+        "notion_url": "cfi_eoBPfnbbCWfS3CnbbYCbD4",
+        "notion_last_sync": "cfi_r8AYnDjHMH7XCV5GsK7A8c",  # date type
+    },
+}
+
+# Standard Notion field names -> workspace-specific property names
+WORKSPACE_FIELD_MAPPINGS = {
+    "Livepeer": {
+        "Est Duration Hrs": "Est Duration Hrs",
+        "Due date": "Due date",
+        "Priority": "Priority",
+        "Status": "Status",
+        "Motion Last Sync": "Motion Last Sync",
+    },
+    "Vanquish": {
+        "Est Duration Hrs": "Est. Duration Hrs",
+        "Due date": "Due date",  # Personal hub uses "Due date" (lowercase 'd')
+        "Priority": "Priority",
+        "Status": "Status",
+        "Motion Last Sync": "Motion Last Sync",
+    },
+    "Hub": {
+        "Est Duration Hrs": "Est Duration Hrs",
+        "Due date": "Due date",  # Hub uses "Due date" (lowercase 'd')
+        "Priority": "Priority",
+        "Status": "Status",
+        "Motion Last Sync": "Motion Last Sync",
+    },
+}
+
+# Priority values, split by direction so no key means two things
+PRIORITY_N2M = {"Low": "LOW", "Medium": "MEDIUM", "High": "HIGH", "ASAP": "ASAP"}
+PRIORITY_M2N = {"LOW": "Low", "MEDIUM": "Medium", "HIGH": "High", "ASAP": "ASAP"}
+
+# Status values, split by direction; "Todo" is a valid name on both sides
+STATUS_N2M = {
+    # Using actual Notion database status values
+    "Todo": "Todo",  # Motion's own status name, which is what tasks were sent
+    "Backlog": "TODO",
+    "In Progress": "IN_PROGRESS",
+    "Completed": "COMPLETED",
+}
+STATUS_M2N = {
+    # Using actual Motion status values
+    "Todo": "Todo",  # Motion uses "Todo", keep as-is for Notion
+    "TODO": "Todo",  # Also handle uppercase version
+    "IN_PROGRESS": "In Progress",
+    "COMPLETED": "Completed",
+    "CANCELLED": "Canceled",  # Map cancelled to completed since no direct equivalent
+}
+
+# Combined lookups kept for get_*_mapping; Notion → Motion wins on shared keys
+PRIORITY_MAP = {**PRIORITY_M2N, **PRIORITY_N2M}
+STATUS_MAP = {**STATUS_M2N, **STATUS_N2M}
+
+# Notion statuses never synced to Motion; anything else (including statuses
+# added later) is picked up
+EXCLUDED_STATUS_FILTER = {
+    "and": [
+        {"property": "Status", "status": {"does_not_equal": status}}
+        for status in ("Backlog", "Completed", "Canceled")
+    ]
+}
+
+# Notion block type -> prefix for its text in Motion descriptions
+BLOCK_PREFIXES = {
+    "paragraph": "",
+    "heading_1": "# ",
+    "heading_2": "## ",
+    "heading_3": "### ",
+    "bulleted_list_item": "• ",
+    "numbered_list_item": "1. ",
+    "to_do": "- [ ] ",  # "- [x] " when checked
+}
+
+# Auto-scheduling sent with every Motion create/update; the deadline type makes
+# Motion properly handle due dates. Shared payload, never mutated.
+AUTO_SCHEDULED = {"schedule": "Work Hours", "deadlineType": "SOFT"}
+
+# Max in-flight requests per API across all worker threads
+MOTION_MAX_IN_FLIGHT = 8
+NOTION_MAX_IN_FLIGHT = 16
+
+# Notion's documented average limit, in requests per second per integration
+# token; the in-flight cap above does not bound the rate on its own
+NOTION_RATE_LIMIT = 3
+
+# Fields Motion stores in its own format, so our value never reads back equal
+MOTION_REFORMATTED_FIELDS = frozenset({"description"})
+
+# Seconds to wait for Motion to connect / respond before giving up
+MOTION_REQUEST_TIMEOUT = (10, 30)
+
+# Methods safe to resend after a dropped connection or 5xx; a repeated POST
+# can create a second task or custom-field value
+IDEMPOTENT_METHODS = frozenset({"GET", "PATCH"})
+
+
+@dataclass(frozen=True, slots=True)
+class SyncConfig:
+    """Validated sync configuration, read once from the environment."""
+
+    motion_api_key: str
+    hub_token: str
+    hub_db_id: str
+    hub_user_id: str
+    hub_motion_workspace_id: Optional[str]
+    # External workspace name -> {api_key, db_id, user_id, motion_workspace_id}
+    workspaces: Mapping[str, Mapping[str, Optional[str]]] = field(default_factory=dict)
+    # External workspace name -> missing environment variables
+    incomplete_workspaces: Mapping[str, Tuple[str, ...]] = field(default_factory=dict)
+    motion_custom_fields: Mapping[str, Mapping[str, str]] = field(
+        default_factory=lambda: MOTION_CUSTOM_FIELDS
+    )
+    state_path: str = "~/.motion_notion_sync_state.json"
+    # Motion API requests allowed per minute, shared by all worker threads
+    motion_rate_limit: int = 12
+    # Worker threads used to process tasks concurrently within a sync direction
+    max_workers: int = 4
+
+    @classmethod
+    def from_env(cls) -> "SyncConfig":
+        motion_api_key = os.getenv("MOTION_API_KEY")
+        if not motion_api_key:
+            raise ValueError("MOTION_API_KEY environment variable is required")
+
+        # Hub workspace (backwards compatibility: check both HUB and PERSONAL)
+        hub_token = os.getenv("HUB_NOTION_API_KEY") or os.getenv(
+            "PERSONAL_NOTION_API_KEY"
+        )
+        hub_db_id = os.getenv("HUB_NOTION_DB_ID") or os.getenv("PERSONAL_NOTION_DB_ID")
+        hub_user_id = os.getenv("HUB_NOTION_USER_ID") or os.getenv(
+            "PERSONAL_NOTION_USER_ID"
+        )
+        if not all([hub_token, hub_db_id, hub_user_id]):
+            raise ValueError(
+                "Hub workspace requires HUB_NOTION_API_KEY, HUB_NOTION_DB_ID, and HUB_NOTION_USER_ID"
+            )
+
+        # Auto-discover external workspaces from all *_NOTION_DB_ID patterns
+        workspaces = {}
+        incomplete_workspaces = {}
+        for key, value in os.environ.items():
+            if not key.endswith("_NOTION_DB_ID") or not value:
+                continue
+            workspace_name = key.replace("_NOTION_DB_ID", "")
+
+            # Skip HUB and PERSONAL (hub workspace, handled separately)
+            if workspace_name in ["HUB", "PERSONAL"]:
+                continue
+
+            api_key = os.getenv(f"{workspace_name}_NOTION_API_KEY")
+            user_id = os.getenv(f"{workspace_name}_NOTION_USER_ID")
+            if api_key and user_id:
+                workspaces[workspace_name] = {
+                    "api_key": api_key,
+                    "db_id": value,
+                    "user_id": user_id,
+                    "motion_workspace_id": os.getenv(
+                        f"MOTION_{workspace_name}_WORKSPACE_ID"
+                    ),
+                }
+            else:
+                incomplete_workspaces[workspace_name] = tuple(
+                    var
+                    for var, present in (
+                        (f"{workspace_name}_NOTION_API_KEY", api_key),
+                        (f"{workspace_name}_NOTION_USER_ID", user_id),
+                    )
+                    if not present
+                )
+
+        return cls(
+            motion_api_key=motion_api_key,
+            hub_token=hub_token,
+            hub_db_id=hub_db_id,
+            hub_user_id=hub_user_id,
+            hub_motion_workspace_id=os.getenv("MOTION_HUB_WORKSPACE_ID")
+            or os.getenv("MOTION_PERSONAL_WORKSPACE_ID"),
+            workspaces=workspaces,
+            incomplete_workspaces=incomplete_workspaces,
+            state_path=os.getenv(
+                "MOTION_SYNC_STATE_PATH", "~/.motion_notion_sync_state.json"
+            ),
+            motion_rate_limit=int(os.getenv("MOTION_RATE_LIMIT", "12")),
+            max_workers=max(1, int(os.getenv("SYNC_MAX_WORKERS", "4"))),
+        )
+
+
+@cache
+def load_config() -> SyncConfig:
+    """Load environment files and build the sync config (once per process)."""
+    load_dotenv(".env.dev", override=True)
+    load_dotenv(".env", override=False)
+    return SyncConfig.from_env()
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an API timestamp; the sync window value repeats for every task."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@lru_cache(maxsize=128)
+def _hours_to_minutes(hours: Optional[float]) -> int:
+    """Convert hours to Motion minutes; durations cluster on a few values."""
+    if hours is None or hours == 0:
+        return 60  # Default to 60 minutes
+    return int(hours * 60)
+
+
+@lru_cache(maxsize=128)
+def _minutes_to_hours(minutes: Optional[int]) -> float:
+    """Convert Motion minutes to Notion hours (the inverse of _hours_to_minutes)."""
+    if minutes is None or minutes == 0:
+        return 1.0  # Default to 1 hour
+    return round(minutes / 60, 1)
+
+
+def _normalize_text(value: Any) -> str:
+    """Normalize values for comparison."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value)
+
+
+def _normalize_priority(priority: Any) -> str:
+    """Normalize priority values for comparison."""
+    if priority is None:
+        return "NONE"
+    return str(priority).upper()
+
+
+def _normalize_due_date(due_date: Any) -> Optional[str]:
+    """Normalize due date for comparison - extract just YYYY-MM-DD."""
+    if due_date is None:
+        return None
+    # If it's a dict with 'start', extract the start date
+    if isinstance(due_date, dict) and "start" in due_date:
+        due_date = due_date["start"]
+    # ISO dates start with YYYY-MM-DD, so the date part is a fixed slice
+    return str(due_date)[:10]
+
+
+def _retry_wait(
+    headers: Mapping[str, str], attempt: int, base: float, max_wait: float = 60
+) -> float:
+    """Seconds to wait before retrying: Retry-After if given, else backoff."""
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(float(retry_after), max_wait)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+
+    # Exponential backoff with equal jitter so parallel workers don't retry in sync
+    backoff = min(base * 2**attempt, max_wait)
+    return backoff / 2 + random.uniform(0, backoff / 2)
+
+
+class BoundedClient(Client):
+    """Notion client whose requests take a slot from a shared semaphore.
+
+    Requests are also spaced to Notion's per-token rate limit, and a
+    ``rate_limited`` response is retried after its Retry-After delay.
+    """
+
+    def __init__(
+        self,
+        api_slot: Callable,
+        rate_limit: float = NOTION_RATE_LIMIT,
+        rate_limit_retries: int = 4,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self._api_slot = api_slot
+        self._rate_limit_retries = rate_limit_retries
+        # Shared by every thread using this client (one client per token)
+        self._min_interval = 1 / rate_limit
+        self._next_request_at = 0.0
+        self._rate_lock = threading.Lock()
+
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep until this client's next request slot under the rate limit."""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self._min_interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        for attempt in range(self._rate_limit_retries + 1):
+            self._wait_for_rate_limit()
+            try:
+                with self._api_slot("notion"):
+                    return super().request(*args, **kwargs)
+            except APIResponseError as e:
+                retries_left = attempt < self._rate_limit_retries
+                if e.code != APIErrorCode.RateLimited or not retries_left:
+                    raise
+                wait_time = _retry_wait(e.headers, attempt, base=1)
+                logging.getLogger(__name__).warning(
+                    "⚠️ Notion API rate limit hit (attempt %s/%s), waiting %.1fs...",
+                    attempt + 1,
+                    self._rate_limit_retries + 1,
+                    wait_time,
+                )
+                time.sleep(wait_time)
+
+    def _parse_response(self, response: httpx.Response) -> Any:
+        # Query pages are large; decode successes with orjson when available and
+        # leave error responses to the SDK so its APIResponseError mapping holds
+        if response.is_success:
+            return _json_loads(response.content)
+        return super()._parse_response(response)
+
+
+class LazyClients(dict):
+    """Workspace name -> Notion client, created on first access.
+
+    Full syncs only talk to the Hub, so external workspace clients (and their
+    connection pools) are only built if something actually uses them.
+    """
+
+    def __init__(self, factory: Callable[[str], Client], tokens: Dict[str, str]):
+        super().__init__()
+        self._factory = factory
+        self._tokens = tokens
+        self._lock = threading.Lock()
+
+    def __missing__(self, workspace: str) -> Client:
+        if workspace not in self._tokens:
+            raise KeyError(workspace)
+        with self._lock:
+            if not dict.__contains__(self, workspace):
+                self[workspace] = self._factory(self._tokens[workspace])
+            return dict.__getitem__(self, workspace)
 
 
 class MotionNotionSync:
@@ -47,10 +457,13 @@ class MotionNotionSync:
         """Initialize the sync client with API credentials."""
         self.dry_run = dry_run
         self.logger = self._setup_logging()
+        self.cfg = load_config()
 
-        # Load environment variables
-        load_dotenv(".env.dev", override=True)
-        load_dotenv(".env", override=False)
+        # Cap concurrent in-flight calls per API (shared by all worker threads)
+        self._api_semaphores = {
+            "motion": threading.BoundedSemaphore(MOTION_MAX_IN_FLIGHT),
+            "notion": threading.BoundedSemaphore(NOTION_MAX_IN_FLIGHT),
+        }
 
         # Initialize API clients
         self._init_motion_client()
@@ -58,35 +471,42 @@ class MotionNotionSync:
         self._discover_workspaces()
         self._validate_workspace_config()
 
-        # Motion custom field IDs (tied to specific workspaces)
-        # TODO: These should be moved to environment variables for full dynamic configuration
-        self.motion_custom_fields = {
-            "Hub": {
-                "notion_id": "cfi_4G15DQNV797KHaNzQqsxt3",
-                "notion_url": "cfi_RBFEnK3uN2Ho2o8XQXdWfv",
-                "notion_last_sync": "cfi_U1o2VDha6sjs3UFwFH8xC1",  # text type
-            },
-            # Keep backwards compatibility
-            "Personal": {
-                "notion_id": "cfi_4G15DQNV797KHaNzQqsxt3",
-                "notion_url": "cfi_RBFEnK3uN2Ho2o8XQXdWfv",
-                "notion_last_sync": "cfi_U1o2VDha6sjs3UFwFH8xC1",  # text type
-            },
-            "LIVEPEER": {
-                "notion_id": "cfi_rLcNg95UQ1Cggz2YAnYjsL",
-                "notion_url": "cfi_g85FVuj115igtCPLVCo34t",
-                "notion_last_sync": "cfi_1S1Fi4oP3adjT9Ab88U2Ja",  # date type
-            },
-            "VANQUISH": {
-                "notion_id": "cfi_vS8mS9agZUaCDMX88usZXq",
-                "notion_url": "cfi_eoBPfnbbCWfS3CnbbYCbD4",
-                "notion_last_sync": "cfi_r8AYnDjHMH7XCV5GsK7A8c",  # date type
-            },
-        }
+        self.motion_custom_fields = self.cfg.motion_custom_fields
+
+        # Persistent sync state (last successful sync per workspace/direction)
+        self._state_path = Path(self.cfg.state_path).expanduser()
+        self._state = self._load_state()
+        # page_id -> [last_edited_time, description] for unchanged-page reuse
+        self._description_cache = self._state.setdefault("descriptions", {})
+        self._state.pop("synced_values", None)  # Written by older versions
+        # page_id -> Motion updatedTime of the completion last pushed to Notion
+        self._completions = self._state.setdefault("completions", {})
+        # motion_id -> {field: hash of the value we last PATCHed}
+        self._last_patched = self._state.setdefault("last_patched", {})
+        # page_id -> [Notion last_edited_time, Motion updatedTime] when last seen
+        # in agreement; an exact match means the Notion → Motion diff can be skipped
+        self._in_sync_edits = self._state.setdefault("in_sync_edits", {})
+
+        # (notion_id, motion_id) pairs awaiting a batched Hub write-back
+        self._pending_motion_id_writes: List[Tuple[str, str]] = []
+        self._pending_lock = threading.Lock()
 
         if self.dry_run:
             self.logger.info("🧪 Running in DRY RUN mode - no changes will be made")
 
+    def __enter__(self) -> "MotionNotionSync":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Flush queued Notion writes and release pooled HTTP connections."""
+        self.flush_notion_motion_ids()
+        self.motion_session.close()
+        for client in self.workspace_clients.values():
+            client.close()
+
     def _setup_logging(self) -> logging.Logger:
         """Set up logging configuration."""
         log_level = os.getenv("SYNC_LOG_LEVEL", "INFO").upper()
@@ -100,91 +520,82 @@ class MotionNotionSync:
 
     def _init_motion_client(self):
         """Initialize Motion API client."""
-        self.motion_api_key = os.getenv("MOTION_API_KEY")
-        if not self.motion_api_key:
-            raise ValueError("MOTION_API_KEY environment variable is required")
-
+        self.motion_api_key = self.cfg.motion_api_key
         self.motion_base_url = "https://api.usemotion.com/v1"
         self.motion_headers = {
             "X-API-Key": self.motion_api_key,
             "Content-Type": "application/json",
         }
 
-    def _init_hub_workspace(self):
-        """Initialize the hub workspace (main task database)."""
-        # Hub workspace (backwards compatibility: check both HUB and PERSONAL)
-        self.hub_token = os.getenv("HUB_NOTION_API_KEY") or os.getenv(
-            "PERSONAL_NOTION_API_KEY"
+        # One pooled session so Motion calls reuse TCP/TLS connections
+        self.motion_session = requests.Session()
+        self.motion_session.headers.update(self.motion_headers)
+        self.motion_session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(
+                pool_connections=2, pool_maxsize=MOTION_MAX_IN_FLIGHT
+            ),
         )
-        self.hub_db_id = os.getenv("HUB_NOTION_DB_ID") or os.getenv(
-            "PERSONAL_NOTION_DB_ID"
-        )
-        self.hub_user_id = os.getenv("HUB_NOTION_USER_ID") or os.getenv(
-            "PERSONAL_NOTION_USER_ID"
-        )
-        self.hub_motion_workspace_id = os.getenv(
-            "MOTION_HUB_WORKSPACE_ID"
-        ) or os.getenv("MOTION_PERSONAL_WORKSPACE_ID")
 
-        if not all([self.hub_token, self.hub_db_id, self.hub_user_id]):
-            raise ValueError(
-                "Hub workspace requires HUB_NOTION_API_KEY, HUB_NOTION_DB_ID, and HUB_NOTION_USER_ID"
-            )
+        # Sliding-window rate limiter shared by every thread calling Motion
+        self._motion_request_times: collections.deque = collections.deque()
+        self._motion_rate_limit = self.cfg.motion_rate_limit
+        self._motion_rate_window = 60  # seconds
+        self._motion_rate_lock = threading.Lock()
+
+    def _init_hub_workspace(self):
+        """Initialize the hub workspace (main task database)."""
+        self.hub_token = self.cfg.hub_token
+        self.hub_db_id = self.cfg.hub_db_id
+        self.hub_user_id = self.cfg.hub_user_id
+        self.hub_motion_workspace_id = self.cfg.hub_motion_workspace_id
 
         # Initialize hub client
-        self.hub_client = Client(auth=self.hub_token)
+        self.hub_client = self._new_notion_client(self.hub_token)
+
+    def _new_notion_client(self, token: str) -> BoundedClient:
+        """Create a Notion client whose requests multiplex over HTTP/2 if possible."""
+        http = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=NOTION_MAX_IN_FLIGHT,
+                max_keepalive_connections=NOTION_MAX_IN_FLIGHT,
+            ),
+        )
+        return BoundedClient(self._api_slot, auth=token, client=http)
 
     def _discover_workspaces(self):
-        """Auto-discover external workspaces from environment variables."""
-        self.workspaces = {}
-        self.workspace_clients = {"Hub": self.hub_client}
+        """Set up clients for the external workspaces found in the config."""
+        self.workspaces = dict(self.cfg.workspaces)
+        self.workspace_clients = LazyClients(
+            self._new_notion_client,
+            {name: ws["api_key"] for name, ws in self.workspaces.items()},
+        )
+        self.workspace_clients["Hub"] = self.hub_client
         self.notion_databases = {"Hub": self.hub_db_id}
         self.notion_user_ids = {"Hub": self.hub_user_id}
         self.motion_workspaces = {"Hub": self.hub_motion_workspace_id}
 
-        # Find all *_NOTION_DB_ID patterns
-        for key, value in os.environ.items():
-            if key.endswith("_NOTION_DB_ID") and value:
-                workspace_name = key.replace("_NOTION_DB_ID", "")
+        for workspace_name, ws in self.workspaces.items():
+            # Store references; the client is created on first use
+            self.notion_databases[workspace_name] = ws["db_id"]
+            self.notion_user_ids[workspace_name] = ws["user_id"]
+            self.motion_workspaces[workspace_name] = ws["motion_workspace_id"]
 
-                # Skip HUB and PERSONAL (hub workspace, handled separately)
-                if workspace_name in ["HUB", "PERSONAL"]:
-                    continue
+            self.logger.info("📊 Discovered workspace: %s", workspace_name)
+            if not ws["motion_workspace_id"]:
+                self.logger.warning(
+                    "⚠️ No Motion workspace ID configured for %s (MOTION_%s_WORKSPACE_ID)",
+                    workspace_name,
+                    workspace_name,
+                )
 
-                # Check if this workspace has all required vars
-                api_key = os.getenv(f"{workspace_name}_NOTION_API_KEY")
-                user_id = os.getenv(f"{workspace_name}_NOTION_USER_ID")
-                motion_workspace_id = os.getenv(f"MOTION_{workspace_name}_WORKSPACE_ID")
-
-                if api_key and user_id:
-                    # Store workspace configuration
-                    self.workspaces[workspace_name] = {
-                        "api_key": api_key,
-                        "db_id": value,
-                        "user_id": user_id,
-                        "motion_workspace_id": motion_workspace_id,
-                    }
-
-                    # Initialize client and store references
-                    self.workspace_clients[workspace_name] = Client(auth=api_key)
-                    self.notion_databases[workspace_name] = value
-                    self.notion_user_ids[workspace_name] = user_id
-                    self.motion_workspaces[workspace_name] = motion_workspace_id
-
-                    self.logger.info(f"📊 Discovered workspace: {workspace_name}")
-                    if not motion_workspace_id:
-                        self.logger.warning(
-                            f"⚠️ No Motion workspace ID configured for {workspace_name} (MOTION_{workspace_name}_WORKSPACE_ID)"
-                        )
-                else:
-                    missing_vars = []
-                    if not api_key:
-                        missing_vars.append(f"{workspace_name}_NOTION_API_KEY")
-                    if not user_id:
-                        missing_vars.append(f"{workspace_name}_NOTION_USER_ID")
-                    self.logger.warning(
-                        f"⚠️ Incomplete workspace config for {workspace_name}, missing: {missing_vars}"
-                    )
+        for workspace_name, missing_vars in self.cfg.incomplete_workspaces.items():
+            self.logger.warning(
+                "⚠️ Incomplete workspace config for %s, missing: %s",
+                workspace_name,
+                list(missing_vars),
+            )
 
     def _validate_workspace_config(self):
         """Validate that we have at least the hub workspace configured."""
@@ -193,53 +604,146 @@ class MotionNotionSync:
 
         workspace_count = len(self.workspaces)
         self.logger.info(
-            f"✅ Initialized {workspace_count} external workspaces: {list(self.workspaces.keys())}"
+            "✅ Initialized %s external workspaces: %s",
+            workspace_count,
+            list(self.workspaces.keys()),
         )
 
+    # === SYNC STATE ===
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Load persisted sync state from disk."""
+        if not self._state_path.exists():
+            return {}
+        try:
+            return _json_loads(self._state_path.read_bytes())
+        except (OSError, ValueError) as e:
+            self.logger.warning(
+                "⚠️ Could not read sync state %s: %s", self._state_path, e
+            )
+            return {}
+
+    def _save_state(self):
+        """Persist sync state to disk."""
+        if self.dry_run:
+            return
+        # Write then rename so a crash mid-write never leaves a truncated state
+        tmp_path = self._state_path.with_name(self._state_path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(_json_dumps(self._state, indent=True))
+            os.replace(tmp_path, self._state_path)
+        except OSError as e:
+            self.logger.warning(
+                "⚠️ Could not write sync state %s: %s", self._state_path, e
+            )
+
+    def get_last_sync(self, workspace: str, direction: str) -> Optional[str]:
+        """Return the ISO timestamp of the last successful sync, if any."""
+        return self._state.get(workspace, {}).get(direction, {}).get("last_sync")
+
+    def set_last_sync(self, workspace: str, direction: str, sync_time: str):
+        """Record a successful sync (persisted by the next ``_save_state``)."""
+        workspace_state = self._state.setdefault(workspace, {})
+        workspace_state.setdefault(direction, {})["last_sync"] = sync_time
+
+    def _prune_state(
+        self, notion_ids: Iterable[str], motion_tasks: List[Dict[str, Any]]
+    ):
+        """Drop cached entries for pages and tasks a full sync no longer sees.
+
+        ``notion_ids`` are the active Hub pages; completions are kept for any
+        page a completed Motion task still points at.
+        """
+        notion_ids = set(notion_ids)
+        completed_ids = set(self._completed_by_notion_id(motion_tasks))
+        motion_ids = {task["id"] for task in motion_tasks if task.get("id")}
+        for cache, live_ids in (
+            (self._description_cache, notion_ids),
+            (self._in_sync_edits, notion_ids),
+            (self._completions, completed_ids),
+            (self._last_patched, motion_ids),
+        ):
+            for stale_id in cache.keys() - live_ids:
+                del cache[stale_id]
+
+    def _updated_since(self, updated_time: Optional[str], since: str) -> bool:
+        """Return True if ``updated_time`` is on or after ``since`` (or unknown)."""
+        if not updated_time:
+            return True
+        try:
+            return _parse_iso(updated_time) >= _parse_iso(since)
+        except ValueError:
+            return True
+
+    @staticmethod
+    def _comparable(field: str, value: Any) -> Any:
+        """Normalize a Motion field value so synced and current values compare."""
+        if field == "dueDate" and value:
+            return str(value)[:10]  # Date part only; Motion adds a time
+        if field == "status" and isinstance(value, dict):
+            return value.get("name")
+        return value
+
+    @staticmethod
+    def _value_hash(value: Any) -> str:
+        """Short stable hash of a payload value for the last-PATCHed cache."""
+        return hashlib.sha1(_json_dumps(value, sort_keys=True)).hexdigest()
+
+    def _patch_delta(
+        self, motion_id: str, motion_task: Dict[str, Any], updates: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Drop update fields that already match Motion (or, for fields Motion
+        reformats, our last PATCH)."""
+        prior = self._last_patched.get(motion_id, {})
+        delta = {}
+        for field, value in updates.items():
+            current = motion_task.get(field)
+            if isinstance(value, dict) and isinstance(current, dict):
+                # Nested settings (autoScheduled): Motion echoes extra keys back
+                if all(current.get(k) == v for k, v in value.items()):
+                    continue
+            elif current is not None and self._comparable(
+                field, value
+            ) == self._comparable(field, current):
+                continue
+            # Motion reformats the description it echoes back, so it never
+            # compares equal; trust our last send for that field only
+            if field in MOTION_REFORMATTED_FIELDS and prior.get(
+                field
+            ) == self._value_hash(value):
+                continue
+            delta[field] = value
+        return delta
+
+    def _record_patched(self, motion_id: str, updates: Dict[str, Any]):
+        """Remember hashes of the reformatted fields just PATCHed to a task."""
+        if self.dry_run:
+            return
+        hashes = {
+            field: self._value_hash(value)
+            for field, value in updates.items()
+            if field in MOTION_REFORMATTED_FIELDS
+        }
+        if hashes:
+            self._last_patched.setdefault(motion_id, {}).update(hashes)
+
     # === FIELD MAPPING HELPERS ===
 
     def get_priority_mapping(self) -> Dict[str, str]:
         """Map priority values between Notion and Motion."""
-        return {
-            # Notion → Motion
-            "Low": "LOW",
-            "Medium": "MEDIUM",
-            "High": "HIGH",
-            "ASAP": "ASAP",
-            # Motion → Notion
-            "LOW": "Low",
-            "MEDIUM": "Medium",
-            "HIGH": "High",
-            "ASAP": "ASAP",
-        }
+        return PRIORITY_MAP
 
     def get_status_mapping(self) -> Dict[str, str]:
         """Map status values between Notion and Motion."""
-        return {
-            # Notion → Motion (using actual Notion database status values)
-            "Todo": "TODO",
-            "Backlog": "TODO",
-            "In Progress": "IN_PROGRESS",
-            "Completed": "COMPLETED",
-            # Motion → Notion (using actual Motion status values)
-            "Todo": "Todo",  # Motion uses "Todo", keep as-is for Notion
-            "TODO": "Todo",  # Also handle uppercase version
-            "IN_PROGRESS": "In Progress",
-            "COMPLETED": "Completed",
-            "CANCELLED": "Canceled",  # Map cancelled to completed since no direct equivalent
-        }
+        return STATUS_MAP
 
     def convert_hours_to_minutes(self, hours: float) -> int:
         """Convert hours to minutes for Motion duration field."""
-        if hours is None or hours == 0:
-            return 60  # Default to 60 minutes
-        return int(hours * 60)
+        return _hours_to_minutes(hours)
 
     def convert_minutes_to_hours(self, minutes: int) -> float:
         """Convert minutes to hours for Notion duration field."""
-        if minutes is None or minutes == 0:
-            return 1.0  # Default to 1 hour
-        return round(minutes / 60, 1)
+        return _minutes_to_hours(minutes)
 
     def extract_due_date_start(self, notion_date: Dict[str, Any]) -> Optional[str]:
         """Extract start date from Notion date field."""
@@ -263,7 +767,7 @@ class MotionNotionSync:
             # Add 6 hours to prevent Motion from interpreting UTC midnight as previous day
             # This ensures the date displays correctly in user's local timezone (UTC-5)
             result = f"{date_only}T06:00:00.000Z"
-            self.logger.info(f"🔍 DEBUG - Sending due date to Motion: {result}")
+            self.logger.debug("🔍 DEBUG - Sending due date to Motion: %s", result)
             return result
 
         return None
@@ -274,76 +778,110 @@ class MotionNotionSync:
 
         for block in blocks:
             block_type = block.get("type", "")
+            prefix = BLOCK_PREFIXES.get(block_type)
+            if prefix is None:
+                continue  # Block type not carried over to Motion
 
-            if block_type == "paragraph":
-                text = self._extract_rich_text(
-                    block.get("paragraph", {}).get("rich_text", [])
-                )
-                if text.strip():
-                    description_parts.append(text)
-
-            elif block_type == "heading_1":
-                text = self._extract_rich_text(
-                    block.get("heading_1", {}).get("rich_text", [])
-                )
-                if text.strip():
-                    description_parts.append(f"# {text}")
-
-            elif block_type == "heading_2":
-                text = self._extract_rich_text(
-                    block.get("heading_2", {}).get("rich_text", [])
-                )
-                if text.strip():
-                    description_parts.append(f"## {text}")
-
-            elif block_type == "heading_3":
-                text = self._extract_rich_text(
-                    block.get("heading_3", {}).get("rich_text", [])
-                )
-                if text.strip():
-                    description_parts.append(f"### {text}")
-
-            elif block_type == "bulleted_list_item":
-                text = self._extract_rich_text(
-                    block.get("bulleted_list_item", {}).get("rich_text", [])
-                )
-                if text.strip():
-                    description_parts.append(f"• {text}")
+            content = block.get(block_type, {})
+            text = self._extract_rich_text(content.get("rich_text", []))
+            if not text.strip():
+                continue
 
-            elif block_type == "numbered_list_item":
-                text = self._extract_rich_text(
-                    block.get("numbered_list_item", {}).get("rich_text", [])
-                )
-                if text.strip():
-                    description_parts.append(f"1. {text}")
+            # Check if the to-do item is checked or unchecked
+            if block_type == "to_do" and content.get("checked", False):
+                prefix = "- [x] "
+            description_parts.append(prefix + text)
 
-            elif block_type == "to_do":
-                text = self._extract_rich_text(
-                    block.get("to_do", {}).get("rich_text", [])
-                )
-                if text.strip():
-                    # Check if the to-do item is checked or unchecked
-                    is_checked = block.get("to_do", {}).get("checked", False)
-                    checkbox = "[x]" if is_checked else "[ ]"
-                    description_parts.append(f"- {checkbox} {text}")
+        return "\n\n".join(description_parts)
 
-        return "\n\n".join(description_parts) if description_parts else ""
+    def get_notion_description(
+        self, notion_data: Dict[str, Any], workspace: str
+    ) -> str:
+        """Build the Motion description for a Notion page.
+
+        The page's blocks are only fetched when its ``last_edited_time`` differs
+        from the cached copy.
+        """
+        page_id = notion_data["id"]
+        if not page_id:
+            return ""
+
+        edited_at = notion_data.get("updated_at")
+        cached = self._description_cache.get(page_id)
+        if cached and edited_at and cached[0] == edited_at:
+            self.logger.debug("Using cached description for %s", page_id)
+            return cached[1]
+
+        blocks_response = self.workspace_clients[workspace].blocks.children.list(
+            block_id=page_id
+        )
+        description = self.blocks_to_description(blocks_response.get("results", []))
+        if edited_at:
+            self._description_cache[page_id] = [edited_at, description]
+        return description
 
     def _extract_rich_text(self, rich_text_array: List[Dict[str, Any]]) -> str:
         """Extract plain text from Notion rich text array."""
-        text_parts = []
-        for item in rich_text_array:
-            text_parts.append(item.get("plain_text", ""))
-        return "".join(text_parts)
+        if len(rich_text_array) == 1:  # Most common case: a single span
+            return rich_text_array[0].get("plain_text", "")
+        return "".join(item.get("plain_text", "") for item in rich_text_array)
 
     # === MOTION API METHODS ===
 
+    def _map_concurrently(self, fn: Callable, *iterables: Iterable) -> List[Any]:
+        """Run fn over the items on the sync worker pool, preserving order."""
+        items = list(zip(*iterables))
+        if self.cfg.max_workers == 1 or len(items) <= 1:
+            return [fn(*args) for args in items]
+        with ThreadPoolExecutor(max_workers=self.cfg.max_workers) as executor:
+            return list(executor.map(lambda args: fn(*args), items))
+
+    @contextmanager
+    def _api_slot(self, api: str):
+        """Hold one of the API's in-flight slots, logging time spent waiting."""
+        semaphore = self._api_semaphores[api]
+        started = time.monotonic()
+        with semaphore:
+            waited = time.monotonic() - started
+            if waited > 0.05:
+                self.logger.debug("⏳ Waited %.2fs for a %s API slot", waited, api)
+            yield
+
+    def _wait_for_motion_rate_limit(self) -> None:
+        """Sleep if needed to stay within the Motion rate limit window."""
+        with self._motion_rate_lock:
+            now = time.monotonic()
+
+            # Purge timestamps older than the window
+            while (
+                self._motion_request_times
+                and now - self._motion_request_times[0] >= self._motion_rate_window
+            ):
+                self._motion_request_times.popleft()
+
+            if len(self._motion_request_times) >= self._motion_rate_limit:
+                # Wait until the oldest request falls outside the window
+                wait = self._motion_rate_window - (
+                    now - self._motion_request_times[0]
+                )
+                if wait > 0:
+                    self.logger.info(
+                        "⏳ Motion rate limit: %s requests in window, waiting %.1fs",
+                        len(self._motion_request_times),
+                        wait,
+                    )
+                    # Holding the lock makes other threads queue behind this wait
+                    time.sleep(wait)
+                self._motion_request_times.popleft()
+
+            self._motion_request_times.append(time.monotonic())
+
     def motion_request(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict] = None,
-        max_retries: int = 3,
+        max_retries: int = 4,
     ) -> Dict[str, Any]:
         """Make authenticated request to Motion API with retry logic."""
         # Handle beta endpoints that use different base URL
@@ -355,109 +893,147 @@ class MotionNotionSync:
         for attempt in range(max_retries + 1):
             try:
                 # Log the Motion API call
-                self.logger.info(
-                    f"🔗 Motion API: {method.upper()} {endpoint} (attempt {attempt + 1})"
+                self.logger.debug(
+                    "🔗 Motion API: %s %s (attempt %s)",
+                    method.upper(),
+                    endpoint,
+                    attempt + 1,
                 )
+                self._wait_for_motion_rate_limit()
 
-                if method.upper() == "GET":
-                    response = requests.get(url, headers=self.motion_headers)
-                elif method.upper() == "POST":
-                    response = requests.post(
-                        url, headers=self.motion_headers, json=data
-                    )
-                elif method.upper() == "PATCH":
-                    response = requests.patch(
-                        url, headers=self.motion_headers, json=data
-                    )
-                elif method.upper() == "DELETE":
-                    response = requests.delete(url, headers=self.motion_headers)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                with self._api_slot("motion"):
+                    response = self._send_motion_request(method, url, data)
 
                 response.raise_for_status()
 
                 # Log successful response
-                self.logger.info(
-                    f"✅ Motion API: {method.upper()} {endpoint} → {response.status_code}"
+                self.logger.debug(
+                    "✅ Motion API: %s %s → %s",
+                    method.upper(),
+                    endpoint,
+                    response.status_code,
                 )
-
-                # Small delay between successful requests to be respectful
-                if attempt == 0:  # Only delay on first attempt (not retries)
-                    time.sleep(0.1)  # 100ms - just enough to avoid hammering
-
-                return response.json() if response.content else {}
+                return _json_loads(response.content) if response.content else {}
 
             except requests.exceptions.RequestException as e:
-                if (
-                    hasattr(e, "response")
-                    and e.response is not None
-                    and e.response.status_code == 429
-                ):
-                    # Rate limit hit - implement exponential backoff
+                # Only HTTP errors carry a response; connection errors have None
+                response = e.response
+                status = response.status_code if response is not None else None
+                transient = status in (500, 502, 503, 504) or isinstance(
+                    e,
+                    (requests.exceptions.ConnectionError, requests.exceptions.Timeout),
+                )
+                if status == 429:
+                    # Rate limit hit - honor Retry-After, else back off from 10s
                     if attempt < max_retries:
-                        wait_time = 2**attempt * 10  # 10s, 20s, 40s
+                        wait_time = self._retry_wait(response, attempt, base=10)
                         self.logger.warning(
-                            f"⚠️ Motion API Rate limit hit on {method.upper()} {endpoint} (attempt {attempt + 1}/{max_retries + 1}), waiting {wait_time}s before retry..."
+                            "⚠️ Motion API Rate limit hit on %s %s (attempt %s/%s), waiting %.1fs before retry...",
+                            method.upper(),
+                            endpoint,
+                            attempt + 1,
+                            max_retries + 1,
+                            wait_time,
                         )
                         time.sleep(wait_time)
                         continue
                     else:
                         self.logger.error(
-                            f"Rate limit exceeded after {max_retries + 1} attempts"
+                            "Rate limit exceeded after %s attempts", max_retries + 1
                         )
                         raise
-                elif (
-                    hasattr(e, "response")
-                    and e.response is not None
-                    and e.response.status_code in [502, 503, 504]
-                ):
-                    # Server errors - retry with shorter backoff
+                elif transient and method.upper() in IDEMPOTENT_METHODS:
+                    # Server or connection errors - retry with shorter backoff.
+                    # A 429 was never processed, but a POST that timed out or
+                    # 5xx'd may have been, so those are not resent
                     if attempt < max_retries:
-                        wait_time = 2**attempt * 2  # 2s, 4s, 8s
+                        wait_time = self._retry_wait(response, attempt, base=2)
                         self.logger.warning(
-                            f"Server error {e.response.status_code} (attempt {attempt + 1}/{max_retries + 1}), waiting {wait_time}s..."
+                            "Server error %s (attempt %s/%s), waiting %.1fs...",
+                            status or type(e).__name__,
+                            attempt + 1,
+                            max_retries + 1,
+                            wait_time,
                         )
                         time.sleep(wait_time)
                         continue
                     else:
                         self.logger.error(
-                            f"Server error after {max_retries + 1} attempts"
+                            "Server error after %s attempts", max_retries + 1
                         )
                         raise
                 else:
                     # Other errors - don't retry
-                    self.logger.error(f"Motion API request failed: {e}")
-                    if hasattr(e, "response") and e.response is not None:
-                        self.logger.error(f"Response: {e.response.text}")
+                    self.logger.error("Motion API request failed: %s", e)
+                    if response is not None:
+                        self.logger.error("Response: %s", response.text)
                     raise
 
+    def _send_motion_request(
+        self, method: str, url: str, data: Optional[Dict] = None
+    ) -> requests.Response:
+        """Issue a single Motion HTTP request on the pooled session."""
+        method = method.upper()
+        if method not in ("GET", "POST", "PATCH", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        body = _json_dumps(data) if data is not None else None
+        return self.motion_session.request(
+            method, url, data=body, timeout=MOTION_REQUEST_TIMEOUT
+        )
+
+    def _retry_wait(
+        self,
+        response: Optional[requests.Response],
+        attempt: int,
+        base: float,
+        max_wait: float = 60,
+    ) -> float:
+        """Seconds to wait before retrying: Retry-After if given, else backoff."""
+        headers = response.headers if response is not None else {}
+        return _retry_wait(headers, attempt, base, max_wait)
+
     def get_motion_tasks(self, workspace_id: str) -> List[Dict[str, Any]]:
-        """Get all tasks from Motion workspace, including completed ones."""
+        """Get all tasks from Motion workspace, including completed ones.
+
+        Failures are logged and re-raised: an empty list would read as "no
+        tasks" and let the sync advance its watermarks past them.
+        """
         try:
             # Use includeAllStatuses=true to get tasks across all statuses, including completed
-            response = self.motion_request(
-                "GET", f"tasks?workspaceId={workspace_id}&includeAllStatuses=true"
-            )
-            return response.get("tasks", [])
+            endpoint = f"tasks?workspaceId={workspace_id}&includeAllStatuses=true"
+            response = self.motion_request("GET", endpoint)
+            tasks = response.get("tasks", [])
+            # Motion pages the list; a task missing here would cost a GET per task
+            # later (cache miss) or look deleted
+            cursor = response.get("meta", {}).get("nextCursor")
+            while cursor:
+                page = f"{endpoint}&cursor={quote(cursor, safe='')}"
+                response = self.motion_request("GET", page)
+                tasks.extend(response.get("tasks", []))
+                cursor = response.get("meta", {}).get("nextCursor")
+            return tasks
         except Exception as e:
             self.logger.error(
-                f"Failed to get Motion tasks for workspace {workspace_id}: {e}"
+                "Failed to get Motion tasks for workspace %s: %s", workspace_id, e
             )
-            return []
+            raise
 
     def get_motion_task(self, task_id: str) -> Optional[Dict[str, Any]]:
-        """Get a single Motion task by ID."""
+        """Get a single Motion task by ID, or None if Motion has no such task."""
         try:
             return self.motion_request("GET", f"tasks/{task_id}")
-        except Exception as e:
-            self.logger.warning(f"Failed to get Motion task {task_id}: {e}")
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code != 404:
+                raise  # Only a 404 means the task is gone
+            self.logger.warning("Motion task %s not found: %s", task_id, e)
             return None
 
     def create_motion_task(self, task_data: Dict[str, Any]) -> Optional[str]:
         """Create a new task in Motion."""
         if self.dry_run:
             self.logger.info(
-                f"🧪 DRY RUN: Would create Motion task: {task_data.get('name', 'Unknown')}"
+                "🧪 DRY RUN: Would create Motion task: %s",
+                task_data.get("name", "Unknown"),
             )
             return "dry-run-motion-id"
 
@@ -465,11 +1041,13 @@ class MotionNotionSync:
             response = self.motion_request("POST", "tasks", task_data)
             task_id = response.get("id")
             self.logger.info(
-                f"✅ Created Motion task: {task_data.get('name', 'Unknown')} (ID: {task_id})"
+                "✅ Created Motion task: %s (ID: %s)",
+                task_data.get("name", "Unknown"),
+                task_id,
             )
             return task_id
         except Exception as e:
-            self.logger.error(f"Failed to create Motion task: {e}")
+            self.logger.error("Failed to create Motion task: %s", e)
             return None
 
     def update_motion_task(
@@ -478,30 +1056,27 @@ class MotionNotionSync:
         """Update an existing Motion task."""
         if self.dry_run:
             self.logger.info(
-                f"🧪 DRY RUN: Would update Motion task {task_id} with: {list(updates.keys())}"
+                "🧪 DRY RUN: Would update Motion task %s with: %s",
+                task_id,
+                list(updates),
             )
             return True
 
         try:
             self.motion_request("PATCH", f"tasks/{task_id}", updates)
-            self.logger.info(f"✅ Updated Motion task {task_id}")
+            self.logger.debug("✅ Updated Motion task %s", task_id)
 
             # Note: Using property-based change detection instead of timestamps
 
             return True
-        except requests.exceptions.RequestException as e:
-            if (
-                hasattr(e, "response")
-                and e.response is not None
-                and e.response.status_code == 404
-            ):
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 404:
                 # Task not found - let the caller handle recreation
                 raise
-            else:
-                self.logger.error(f"Failed to update Motion task {task_id}: {e}")
-                return False
+            self.logger.error("Failed to update Motion task %s: %s", task_id, e)
+            return False
         except Exception as e:
-            self.logger.error(f"Failed to update Motion task {task_id}: {e}")
+            self.logger.error("Failed to update Motion task %s: %s", task_id, e)
             return False
 
     def set_motion_custom_fields(
@@ -510,7 +1085,7 @@ class MotionNotionSync:
         """Set custom field values for a Motion task."""
         if self.dry_run:
             self.logger.info(
-                f"🧪 DRY RUN: Would set custom fields for Motion task {task_id}"
+                "🧪 DRY RUN: Would set custom fields for Motion task %s", task_id
             )
             return True
 
@@ -536,122 +1111,53 @@ class MotionNotionSync:
                 "POST", f"/beta/custom-field-values/task/{task_id}", notion_url_data
             )
 
-            self.logger.info(f"✅ Set custom fields for Motion task {task_id}")
+            self.logger.info("✅ Set custom fields for Motion task %s", task_id)
             return True
         except Exception as e:
             self.logger.error(
-                f"Failed to set custom fields for Motion task {task_id}: {e}"
+                "Failed to set custom fields for Motion task %s: %s", task_id, e
             )
             return False
 
-    def set_motion_notion_sync_time(
-        self, task_id: str, sync_time: str, workspace: str
-    ) -> bool:
-        """Set Motion custom field for Notion Last Sync timestamp."""
-        if self.dry_run:
-            return True  # Skip in dry run
-
-        try:
-            # Check if we have the custom field ID for this workspace
-            # Use workspace key directly (already processed by caller)
-            custom_fields = self.motion_custom_fields.get(workspace, {})
-            notion_sync_field_id = custom_fields.get("notion_last_sync")
-
-            if not notion_sync_field_id:
-                self.logger.debug(
-                    f"Notion Last Sync custom field not configured for {workspace} workspace"
-                )
-                return True  # Skip if field not configured
-
-            # Use POST approach to set custom field value
-            # Handle both text and date types (Personal is text, others are date)
-            if workspace == "Personal":
-                # Text type - just pass the ISO string
-                value_data = {"type": "text", "value": sync_time}
-            else:
-                # Date type - Motion expects date format
-                value_data = {"type": "date", "value": sync_time}
+    def get_notion_tasks(
+        self, workspace: str, since: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get tasks from Notion database for a workspace.
 
-            sync_data = {
-                "customFieldInstanceId": notion_sync_field_id,
-                "value": value_data,
-            }
-
-            # Debug: Log what we're sending to Motion
-            self.logger.info(f"🔍 DEBUG - Setting custom field: {sync_data}")
-
-            self.motion_request(
-                "POST", f"/beta/custom-field-values/task/{task_id}", sync_data
-            )
-            self.logger.info(
-                f"✅ Set Notion Last Sync time for Motion task {task_id} to {sync_time}"
-            )
-            return True
-        except Exception as e:
-            # Don't fail the whole sync if we can't set sync time - just log and continue
-            self.logger.debug(
-                f"Could not set Notion Last Sync time for Motion task {task_id}: {e}"
-            )
-            return True  # Return True so sync continues
-
-    # === NOTION API METHODS ===
-
-    def get_notion_tasks(self, workspace: str) -> List[Dict[str, Any]]:
-        """Get all tasks from Notion database for a workspace."""
+        If ``since`` is given, only pages edited on or after that ISO timestamp
+        are returned (filtered server-side). Query failures are logged and
+        re-raised.
+        """
         client = self.workspace_clients[workspace]
         database_id = self.notion_databases[workspace]
         user_id = self.notion_user_ids[workspace]
 
+        conditions = [EXCLUDED_STATUS_FILTER]
         # For Hub, skip assignee filtering since all tasks are implicitly yours
-        if workspace in ["Hub", "Personal"]:
-            filter_conditions = {
-                "and": [
-                    {"property": "Status", "status": {"does_not_equal": "Backlog"}},
-                    {
-                        "property": "Status",
-                        "status": {"does_not_equal": "Completed"},
-                    },
-                    {
-                        "property": "Status",
-                        "status": {"does_not_equal": "Canceled"},
-                    },
-                ]
-            }
-        else:
-            # For external workspaces, filter by assignee
-            filter_conditions = {
-                "and": [
-                    {
-                        "property": "Assignee",
-                        "people": {"contains": user_id},
-                    },
-                    {
-                        "and": [
-                            {
-                                "property": "Status",
-                                "status": {"does_not_equal": "Backlog"},
-                            },
-                            {
-                                "property": "Status",
-                                "status": {"does_not_equal": "Completed"},
-                            },
-                            {
-                                "property": "Status",
-                                "status": {"does_not_equal": "Canceled"},
-                            },
-                        ]
-                    },
-                ]
-            }
+        if workspace not in ["Hub", "Personal"]:
+            assignee = {"property": "Assignee", "people": {"contains": user_id}}
+            conditions.append(assignee)
+        filter_conditions = {"and": conditions}
+
+        if since:
+            filter_conditions["and"].append(
+                {
+                    "timestamp": "last_edited_time",
+                    "last_edited_time": {"on_or_after": since},
+                }
+            )
 
         try:
-            response = client.databases.query(
-                database_id=database_id, filter=filter_conditions
+            # Notion returns at most 100 pages per query; follow the cursors
+            return collect_paginated_api(
+                client.databases.query,
+                database_id=database_id,
+                filter=filter_conditions,
+                page_size=100,
             )
-            return response.get("results", [])
         except Exception as e:
-            self.logger.error(f"Failed to get Notion tasks for {workspace}: {e}")
-            return []
+            self.logger.error("Failed to get Notion tasks for %s: %s", workspace, e)
+            raise
 
     def extract_notion_task_data(self, page: Dict[str, Any]) -> Dict[str, Any]:
         """Extract task data from Notion page."""
@@ -699,9 +1205,9 @@ class MotionNotionSync:
         # Debug logging for due date extraction
         task_name = get_title(props.get("Task name"))
         if task_name:  # Only log if we have a task name
-            self.logger.info(f"🔍 DEBUG - Extracting data for task: {task_name}")
-            self.logger.info(f"🔍 DEBUG - Raw 'Due date' property: {due_date_prop}")
-            self.logger.info(f"🔍 DEBUG - Extracted due_date: {due_date_extracted}")
+            self.logger.debug("🔍 DEBUG - Extracting data for task: %s", task_name)
+            self.logger.debug("🔍 DEBUG - Raw 'Due date' property: %s", due_date_prop)
+            self.logger.debug("🔍 DEBUG - Extracted due_date: %s", due_date_extracted)
 
         return {
             "id": page.get("id"),
@@ -722,59 +1228,82 @@ class MotionNotionSync:
 
     # === SYNC LOGIC ===
 
+    def _completed_by_notion_id(
+        self, motion_tasks: List[Dict[str, Any]], since: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Index COMPLETED Motion tasks that carry a Notion ID by that ID.
+
+        This is exactly the set of Notion pages Motion → Notion will touch, so
+        ``sync_full`` can also use it to keep Notion → Motion off those pages.
+        """
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        completed_by_notion_id = {}
+        for task in motion_tasks:
+            custom_field_values = task.get("customFieldValues") or {}
+            notion_id = (custom_field_values.get("Notion ID") or {}).get("value")
+            if not notion_id:
+                continue
+            task_status = task.get("status")
+            status_name = (
+                task_status.get("name", "") if isinstance(task_status, dict) else ""
+            )
+
+            # DEBUG: Log all tasks with Notion IDs and their statuses
+            if debug:
+                self.logger.debug(
+                    "🔍 DEBUG: Task '%s' has status '%s'",
+                    task.get("name", "Unknown"),
+                    status_name or task_status,
+                )
+
+            if status_name.lower() != "completed":
+                continue
+            # Incremental: skip tasks untouched since the last sync
+            if since and not self._updated_since(task.get("updatedTime"), since):
+                continue
+            completed_by_notion_id[notion_id] = task
+        return completed_by_notion_id
+
     def sync_motion_to_notion(
         self,
         workspace: str,
         max_tasks: Optional[int] = None,
         cached_motion_tasks: Optional[List[Dict[str, Any]]] = None,
         cached_notion_tasks: Optional[Dict[str, Dict[str, Any]]] = None,
+        since: Optional[str] = None,
     ) -> Dict[str, int]:
-        """Sync ONLY completed tasks from Motion to Notion (simplified architecture)."""
+        """Sync ONLY completed tasks from Motion to Notion (simplified architecture).
+
+        If ``since`` is given, Motion tasks not updated since that ISO timestamp
+        are skipped (Motion's list endpoint has no server-side updated filter).
+        """
         stats = {"updated": 0, "skipped": 0, "errors": 0}
 
         motion_workspace_id = self.motion_workspaces[workspace]
         if not motion_workspace_id:
-            self.logger.error(f"No Motion workspace ID configured for {workspace}")
+            self.logger.error("No Motion workspace ID configured for %s", workspace)
             return stats
 
         # Use cached Motion tasks if provided, otherwise fetch them
         if cached_motion_tasks is not None:
             motion_tasks = cached_motion_tasks
             self.logger.info(
-                f"📊 Using cached Motion tasks ({len(motion_tasks)} total)"
+                "📊 Using cached Motion tasks (%s total)", len(motion_tasks)
             )
         else:
-            motion_tasks = self.get_motion_tasks(motion_workspace_id)
-
-        # DEBUG: Print all Motion tasks
-        self.logger.info(f"🔍 DEBUG: Total Motion tasks returned: {len(motion_tasks)}")
-        for i, task in enumerate(motion_tasks[:10]):  # Show first 10 tasks
-            task_name = task.get("name", "Unknown")
-            task_status = task.get("status", {})
-            status_name = (
-                task_status.get("name", "No Status")
-                if isinstance(task_status, dict)
-                else task_status
-            )
-            notion_id = (
-                task.get("customFieldValues", {})
-                .get("Notion ID", {})
-                .get("value", "No Notion ID")
-            )
-            self.logger.info(
-                f"🔍 DEBUG: Task {i+1}: '{task_name}' | Status: '{status_name}' | Notion ID: {notion_id}"
+            try:
+                motion_tasks = self.get_motion_tasks(motion_workspace_id)
+            except Exception:
+                stats["errors"] += 1  # Logged by get_motion_tasks
+                return stats
+
+        # DEBUG: Print all Motion tasks (skip building the rows unless enabled)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(
+                "🔍 DEBUG: Total Motion tasks returned: %s", len(motion_tasks)
             )
-
-        # Filter to only COMPLETED tasks that have Notion ID custom field
-        completed_tasks = []
-        custom_fields = self.motion_custom_fields[workspace]
-
-        for task in motion_tasks:
-            custom_field_values = task.get("customFieldValues", {})
-            notion_id_field = custom_field_values.get("Notion ID")
-
-            # DEBUG: Log all tasks with Notion IDs and their statuses
-            if notion_id_field and notion_id_field.get("value"):
+            for i, task in enumerate(motion_tasks[:10]):  # Show first 10 tasks
                 task_name = task.get("name", "Unknown")
                 task_status = task.get("status", {})
                 status_name = (
@@ -782,57 +1311,66 @@ class MotionNotionSync:
                     if isinstance(task_status, dict)
                     else task_status
                 )
-                self.logger.info(
-                    f"🔍 DEBUG: Task '{task_name}' has status '{status_name}'"
+                notion_id = (
+                    task.get("customFieldValues", {})
+                    .get("Notion ID", {})
+                    .get("value", "No Notion ID")
+                )
+                self.logger.debug(
+                    "🔍 DEBUG: Task %s: '%s' | Status: '%s' | Notion ID: %s",
+                    i + 1,
+                    task_name,
+                    status_name,
+                    notion_id,
                 )
 
-            # Only process tasks that are completed AND have Notion ID
-            task_status = task.get("status", {})
-            if (
-                notion_id_field
-                and notion_id_field.get("value")
-                and isinstance(task_status, dict)
-                and task_status.get("name", "").lower() == "completed"
-            ):
-                completed_tasks.append(task)
+        completed_by_notion_id = self._completed_by_notion_id(motion_tasks, since)
 
         # Apply task limit for test mode
         if max_tasks is not None:
-            original_count = len(completed_tasks)
+            original_count = len(completed_by_notion_id)
             # Sort by Notion ID for consistent ordering across sync directions
-            completed_tasks = sorted(
-                completed_tasks,
-                key=lambda t: t["customFieldValues"]["Notion ID"]["value"],
-            )
-            completed_tasks = completed_tasks[:max_tasks]
+            processed_notion_ids = sorted(completed_by_notion_id)[:max_tasks]
             self.logger.info(
-                f"📊 Found {original_count} completed Motion tasks in {workspace}, limiting to {len(completed_tasks)} for testing"
+                "📊 Found %s completed Motion tasks in %s, limiting to %s for testing",
+                original_count,
+                workspace,
+                len(processed_notion_ids),
             )
         else:
+            processed_notion_ids = list(completed_by_notion_id)
             self.logger.info(
-                f"📊 Found {len(completed_tasks)} completed Motion tasks in {workspace}"
+                "📊 Found %s completed Motion tasks in %s",
+                len(processed_notion_ids),
+                workspace,
             )
+        completed_tasks = [completed_by_notion_id[nid] for nid in processed_notion_ids]
 
-        processed_notion_ids = []
-        for motion_task in completed_tasks:
+        def process(motion_task: Dict[str, Any], notion_id: str) -> Optional[bool]:
             try:
-                notion_id = motion_task["customFieldValues"]["Notion ID"]["value"]
-                processed_notion_ids.append(notion_id)
-
                 # Update Notion with completion status and actual duration
                 # Note: _update_notion_from_completed_motion will handle cache lookup and fallback
-                if self._update_notion_from_completed_motion(
+                return self._update_notion_from_completed_motion(
                     motion_task, notion_id, workspace, cached_notion_tasks
-                ):
-                    stats["updated"] += 1
-                else:
-                    stats["skipped"] += 1
-
+                )
             except Exception as e:
                 self.logger.error(
-                    f"Error processing completed Motion task {motion_task.get('id', 'unknown')}: {e}"
+                    "Error processing completed Motion task %s: %s",
+                    motion_task.get("id", "unknown"),
+                    e,
                 )
+                return None
+
+        # Each completed task touches a different Notion page, so run them in parallel
+        for result in self._map_concurrently(
+            process, completed_tasks, processed_notion_ids
+        ):
+            if result is None:
                 stats["errors"] += 1
+            elif result:
+                stats["updated"] += 1
+            else:
+                stats["skipped"] += 1
 
         # Track first processed task for test mode coordination
         if processed_notion_ids:
@@ -841,14 +1379,17 @@ class MotionNotionSync:
 
         # Note: Deleted Motion tasks are ignored - they just disappear from sync
 
-        self.logger.info(f"📊 {workspace} Motion → Notion sync complete: {stats}")
+        self.logger.info("📊 %s Motion → Notion sync complete: %s", workspace, stats)
         return stats
 
     def _update_notion_from_completed_motion(
         self, motion_task: Dict[str, Any], notion_id: str, workspace: str, 
         cached_notion_tasks: Optional[Dict[str, Dict[str, Any]]] = None
-    ) -> bool:
-        """Update Notion task with ONLY status=Completed and actual duration from Motion."""
+    ) -> Optional[bool]:
+        """Update Notion task with ONLY status=Completed and actual duration from Motion.
+
+        Returns True if updated, False if skipped and None on failure.
+        """
         try:
             # Extract actual duration from Motion (in minutes)
             motion_duration_minutes = motion_task.get("duration", 60)  # Default 60 min
@@ -858,24 +1399,50 @@ class MotionNotionSync:
             if cached_notion_tasks and notion_id in cached_notion_tasks:
                 # Use cached data to avoid API call
                 notion_page = cached_notion_tasks[notion_id]
-                self.logger.debug(f"Using cached Notion data for {notion_id}")
+                self.logger.debug("Using cached Notion data for %s", notion_id)
             else:
                 # Fallback to API call if not in cache
                 notion_page = self.workspace_clients[workspace].pages.retrieve(
                     page_id=notion_id
                 )
-                self.logger.debug(f"Cache miss, fetching Notion data via API for {notion_id}")
+                self.logger.debug(
+                    "Cache miss, fetching Notion data via API for %s", notion_id
+                )
             
             notion_data = self.extract_notion_task_data(notion_page)
             current_status = notion_data.get("status", "")
 
             # Skip if already completed in Notion
             if current_status == "Completed":
-                self.logger.info(
-                    f"✅ SKIPPING - Already completed in Notion: {notion_data['task_name']}"
+                self.logger.debug(
+                    "✅ SKIPPING - Already completed in Notion: %s",
+                    notion_data["task_name"],
+                )
+                return False
+
+            # Last write wins: if this same completion was already pushed and the
+            # page was edited afterwards, it was reopened in Notion on purpose
+            motion_updated = motion_task.get("updatedTime")
+            notion_edited = notion_page.get("last_edited_time")
+            if (
+                motion_updated
+                and notion_edited
+                and self._completions.get(notion_id) == motion_updated
+                and _parse_iso(notion_edited) > _parse_iso(motion_updated)
+            ):
+                self.logger.debug(
+                    "⏭️ SKIPPING - Reopened in Notion after Motion completion: %s",
+                    notion_data["task_name"],
                 )
                 return False
 
+            if self.dry_run:
+                self.logger.info(
+                    "🧪 DRY RUN: Would mark as completed in Notion: %s",
+                    notion_data["task_name"],
+                )
+                return True
+
             # Update Notion with completion status and actual duration
             update_data = {
                 "Status": {"status": {"name": "Completed"}},
@@ -885,163 +1452,25 @@ class MotionNotionSync:
             self.workspace_clients[workspace].pages.update(
                 page_id=notion_id, properties=update_data
             )
+            if motion_updated:
+                self._completions[notion_id] = motion_updated
 
             self.logger.info(
-                f"✅ Marked as completed in Notion: {notion_data['task_name']} (actual: {actual_duration_hours}h)"
+                "✅ Marked as completed in Notion: %s (actual: %sh)",
+                notion_data["task_name"],
+                actual_duration_hours,
             )
             return True
 
         except Exception as e:
             self.logger.error(
-                f"Failed to update Notion from completed Motion task: {e}"
-            )
-            return False
-
-    def _update_notion_from_motion(
-        self, motion_task: Dict[str, Any], notion_id: str, workspace: str,
-        cached_notion_tasks: Optional[Dict[str, Dict[str, Any]]] = None
-    ) -> bool:
-        """Update Notion task with Motion task data."""
-        try:
-            # Compare Motion's updatedTime vs Notion's motion_last_sync_time (avoid infinite loops)
-            motion_updated = motion_task.get("updatedTime")
-
-            if motion_updated:
-                try:
-                    motion_dt = datetime.fromisoformat(
-                        motion_updated.replace("Z", "+00:00")
-                    )
-
-                    # Get the Notion task to check motion_last_sync_time (use cache if available)
-                    if cached_notion_tasks and notion_id in cached_notion_tasks:
-                        notion_page = cached_notion_tasks[notion_id]
-                        self.logger.debug(f"🚀 Using cached Notion data for {notion_id}")
-                    else:
-                        # Fallback to API call if not in cache
-                        client = self.workspace_clients[workspace]
-                        notion_page = client.pages.retrieve(page_id=notion_id)
-                        self.logger.debug(f"⚠️ FALLBACK: Individual API call for {notion_id}")
-
-                    # Get motion_last_sync_time from Notion properties
-                    field_mapping = self.get_workspace_field_mapping(workspace)
-                    motion_sync_field = field_mapping.get(
-                        "Motion Last Sync", "Motion Last Sync"
-                    )
-                    motion_sync_prop = notion_page["properties"].get(
-                        motion_sync_field, {}
-                    )
-
-                    # Check if there are actual content differences worth syncing
-                    if not self.has_meaningful_changes(
-                        motion_task, notion_page, workspace
-                    ):
-                        self.logger.info(
-                            f"✅ SKIPPING - No meaningful changes in Motion task: {motion_task['name']}"
-                        )
-                        return True  # Not an error, just no update needed
-
-                    self.logger.info(
-                        f"🔄 UPDATING - Found meaningful changes in Motion task: {motion_task['name']}"
-                    )
-                except Exception as e:
-                    self.logger.debug(
-                        f"Error comparing sync timestamps, proceeding with update: {e}"
-                    )
-
-            # Map Motion fields back to Notion
-            priority_map = self.get_priority_mapping()
-            status_map = self.get_status_mapping()
-
-            # Build Notion updates
-            updates = {}
-
-            # Update status if changed
-            motion_status = motion_task.get("status", {}).get("name", "")
-            notion_status = status_map.get(motion_status, motion_status)
-            if notion_status:
-                updates["Status"] = {"status": {"name": notion_status}}
-
-            # Update priority if changed
-            motion_priority = motion_task.get("priority", "")
-            notion_priority = priority_map.get(motion_priority, motion_priority)
-            if notion_priority:
-                updates["Priority"] = {"select": {"name": notion_priority}}
-
-            # Update duration (convert minutes back to hours)
-            motion_duration = motion_task.get("duration", 0)
-            notion_duration = self.convert_minutes_to_hours(motion_duration)
-            updates["Est Duration Hrs"] = {"number": notion_duration}
-
-            # Update due date if present
-            motion_due_date = motion_task.get("dueDate")
-            if motion_due_date:
-                updates["Due date"] = {"date": {"start": motion_due_date}}
-
-            if self.dry_run:
-                self.logger.info(
-                    f"🧪 DRY RUN: Would update Notion task '{motion_task['name']}' with Motion changes: {list(updates.keys())}"
-                )
-                return True
-
-            if updates:
-                # Apply field mapping for workspace-specific property names
-                field_mapping = self.get_workspace_field_mapping(workspace)
-                mapped_updates = {}
-                for notion_field, value in updates.items():
-                    mapped_field = field_mapping.get(notion_field, notion_field)
-                    mapped_updates[mapped_field] = value
-
-                self.workspace_clients[workspace].pages.update(
-                    page_id=notion_id, properties=mapped_updates
-                )
-                self.logger.info(
-                    f"✅ Updated Notion task from Motion: {motion_task['name']}"
-                )
-
-                # Set "Motion Last Sync" timestamp to track when we last synced from Motion
-                current_time = datetime.now(timezone.utc).isoformat()
-                self.set_notion_motion_sync_time(notion_id, current_time, workspace)
-
-                return True
-            else:
-                self.logger.info(
-                    f"📝 No changes needed for Notion task: {motion_task['name']}"
-                )
-                return True
-
-        except Exception as e:
-            self.logger.error(
-                f"Failed to update Notion task {notion_id} from Motion: {e}"
+                "Failed to update Notion from completed Motion task: %s", e
             )
-            return False
+            return None
 
     def get_workspace_field_mapping(self, workspace: str) -> Dict[str, str]:
         """Get field name mappings for different workspaces."""
-        # Map standard field names to workspace-specific names
-        if workspace == "Livepeer":
-            return {
-                "Est Duration Hrs": "Est Duration Hrs",
-                "Due date": "Due date",
-                "Priority": "Priority",
-                "Status": "Status",
-                "Motion Last Sync": "Motion Last Sync",
-            }
-        elif workspace == "Vanquish":
-            return {
-                "Est Duration Hrs": "Est. Duration Hrs",
-                "Due date": "Due date",  # Personal hub uses "Due date" (lowercase 'd')
-                "Priority": "Priority",
-                "Status": "Status",
-                "Motion Last Sync": "Motion Last Sync",
-            }
-        else:  # Hub (default)
-            return {
-                "Est Duration Hrs": "Est Duration Hrs",
-                "Due date": "Due date",  # Hub uses "Due date" (lowercase 'd')
-                "Priority": "Priority",
-                "Status": "Status",
-                "Motion Last Sync": "Motion Last Sync",
-            }
+        return WORKSPACE_FIELD_MAPPINGS.get(workspace, WORKSPACE_FIELD_MAPPINGS["Hub"])
 
     def sync_notion_to_motion(
         self,
@@ -1057,42 +1486,76 @@ class MotionNotionSync:
         # Use cached Notion tasks if available, otherwise fetch them
         if cached_notion_tasks is not None:
             notion_tasks = cached_notion_tasks
-            self.logger.debug(f"Using cached Notion tasks ({len(notion_tasks)} tasks)")
+            self.logger.debug("Using cached Notion tasks (%s tasks)", len(notion_tasks))
         else:
-            notion_tasks = self.get_notion_tasks(workspace)
-            self.logger.debug(f"Fetched Notion tasks via API ({len(notion_tasks)} tasks)")
+            try:
+                notion_tasks = self.get_notion_tasks(workspace)
+            except Exception:
+                stats["errors"] += 1  # Logged by get_notion_tasks
+                return stats
+            self.logger.debug(
+                "Fetched Notion tasks via API (%s tasks)", len(notion_tasks)
+            )
             
         motion_workspace_id = self.motion_workspaces[workspace]
 
         if not motion_workspace_id:
-            self.logger.error(f"No Motion workspace ID configured for {workspace}")
+            self.logger.error("No Motion workspace ID configured for %s", workspace)
             return stats
 
         # Limit tasks for testing if specified
         if max_tasks is not None:
+            original_count = len(notion_tasks)
             # Sort by Notion ID for consistent ordering across sync directions
             notion_tasks = sorted(notion_tasks, key=lambda t: t["id"])
             notion_tasks = notion_tasks[:max_tasks]
             self.logger.info(
-                f"📊 Found {len(self.get_notion_tasks(workspace))} Notion tasks in {workspace}, limiting to {len(notion_tasks)} for testing"
+                "📊 Found %s Notion tasks in %s, limiting to %s for testing",
+                original_count,
+                workspace,
+                len(notion_tasks),
             )
         else:
             self.logger.info(
-                f"📊 Found {len(notion_tasks)} Notion tasks in {workspace}"
+                "📊 Found %s Notion tasks in %s", len(notion_tasks), workspace
             )
 
-        for notion_task in notion_tasks:
+        skip_ids = set(skip_notion_ids or ())
+
+        # Join the two sides on Notion ID as well, so a Motion task that already
+        # points at an unlinked page (e.g. a lost Motion ID write-back) is
+        # relinked instead of duplicated
+        motion_by_notion_id = {}
+        for motion_task in (cached_motion_tasks_by_id or {}).values():
+            custom_field_values = motion_task.get("customFieldValues") or {}
+            linked_id = (custom_field_values.get("Notion ID") or {}).get("value")
+            if linked_id:
+                motion_by_notion_id[linked_id] = motion_task
+
+        def process(notion_task: Dict[str, Any]) -> str:
+            """Sync one Notion task to Motion and return the stats key to bump."""
+            notion_id = notion_task.get("id")
+
+            # Skip tasks that were just processed by Motion → Notion sync, before
+            # paying for a full property extraction
+            if notion_id in skip_ids:
+                self.logger.debug(
+                    "⏭️ SKIPPING - Task already processed by Motion → Notion: %s",
+                    notion_id,
+                )
+                return "skipped"
+
             notion_data = self.extract_notion_task_data(notion_task)
-            notion_id = notion_data.get("id")
             motion_id = notion_data.get("motion_id")
 
-            # Skip tasks that were just processed by Motion → Notion sync
-            if skip_notion_ids and notion_id in skip_notion_ids:
+            if not motion_id and notion_id in motion_by_notion_id:
+                motion_id = motion_by_notion_id[notion_id]["id"]
                 self.logger.info(
-                    f"⏭️ SKIPPING - Task already processed by Motion → Notion: {notion_data['task_name']}"
+                    "🔗 RELINKING Notion task to existing Motion task: %s",
+                    notion_data["task_name"],
                 )
-                stats["skipped"] += 1
-                continue
+                if not self.dry_run:
+                    self._update_notion_motion_id(notion_id, motion_id, workspace)
 
             if motion_id:
                 # Update existing Motion task
@@ -1100,19 +1563,25 @@ class MotionNotionSync:
                     motion_id, notion_data, workspace, cached_motion_tasks_by_id
                 )
                 if update_result is True:
-                    stats["updated"] += 1
+                    return "updated"
                 elif update_result is False:
-                    stats["skipped"] += 1
+                    return "skipped"
                 else:
-                    stats["errors"] += 1
+                    return "errors"
             else:
                 # Create new Motion task
                 if self._create_motion_from_notion(notion_data, workspace):
-                    stats["created"] += 1
+                    return "created"
                 else:
-                    stats["errors"] += 1
+                    return "errors"
+
+        # Tasks are independent; the worker pool overlaps their API round-trips
+        for outcome in self._map_concurrently(process, notion_tasks):
+            stats[outcome] += 1
 
-        self.logger.info(f"📊 {workspace} → Motion sync complete: {stats}")
+        # An unlinked page would get a duplicate Motion task on the next run
+        stats["errors"] += self.flush_notion_motion_ids()
+        self.logger.info("📊 %s → Motion sync complete: %s", workspace, stats)
         return stats
 
     def sync_specific_notion_task(
@@ -1130,19 +1599,21 @@ class MotionNotionSync:
             if cached_notion_tasks_dict and notion_id in cached_notion_tasks_dict:
                 # Use cached data to avoid API call
                 notion_page = cached_notion_tasks_dict[notion_id]
-                self.logger.debug(f"Using cached Notion data for {notion_id}")
+                self.logger.debug("Using cached Notion data for %s", notion_id)
             else:
                 # Fallback to API call if not in cache
                 notion_page = self.workspace_clients[workspace].pages.retrieve(
                     page_id=notion_id
                 )
-                self.logger.debug(f"Cache miss, fetching Notion data via API for {notion_id}")
+                self.logger.debug(
+                    "Cache miss, fetching Notion data via API for %s", notion_id
+                )
                 
             notion_data = self.extract_notion_task_data(notion_page)
             motion_id = notion_data.get("motion_id")
 
             self.logger.info(
-                f"📊 Processing specific Notion task: {notion_data['task_name']}"
+                "📊 Processing specific Notion task: %s", notion_data["task_name"]
             )
 
             if motion_id:
@@ -1164,10 +1635,13 @@ class MotionNotionSync:
                     stats["errors"] += 1
 
         except Exception as e:
-            self.logger.error(f"Error processing specific Notion task {notion_id}: {e}")
+            self.logger.error(
+                "Error processing specific Notion task %s: %s", notion_id, e
+            )
             stats["errors"] += 1
 
-        self.logger.info(f"📊 {workspace} → Motion specific sync complete: {stats}")
+        stats["errors"] += self.flush_notion_motion_ids()
+        self.logger.info("📊 %s → Motion specific sync complete: %s", workspace, stats)
         return stats
 
     def _create_motion_from_notion(
@@ -1175,18 +1649,6 @@ class MotionNotionSync:
     ) -> bool:
         """Create a new Motion task from Notion data."""
         try:
-            # Get Notion blocks for description
-            blocks = []
-            if notion_data["id"]:
-                blocks_response = self.workspace_clients[
-                    workspace
-                ].blocks.children.list(block_id=notion_data["id"])
-                blocks = blocks_response.get("results", [])
-
-            # Build Motion task data
-            priority_map = self.get_priority_mapping()
-            status_map = self.get_status_mapping()
-
             # Map Notion workspace to Motion workspace ID
             notion_workspace = notion_data.get("workspace", "Hub")
             # Default empty/None workspace to Hub
@@ -1203,12 +1665,15 @@ class MotionNotionSync:
             motion_workspace_id = self.motion_workspaces.get(lookup_key)
 
             self.logger.info(
-                f"🏢 Mapping Notion workspace '{notion_workspace}' to Motion workspace ID: {motion_workspace_id}"
+                "🏢 Mapping Notion workspace '%s' to Motion workspace ID: %s",
+                notion_workspace,
+                motion_workspace_id,
             )
 
             if not motion_workspace_id:
                 self.logger.error(
-                    f"No Motion workspace ID configured for Notion workspace: {notion_workspace}"
+                    "No Motion workspace ID configured for Notion workspace: %s",
+                    notion_workspace,
                 )
                 return False
 
@@ -1216,9 +1681,9 @@ class MotionNotionSync:
             motion_task_data = {
                 "workspaceId": motion_workspace_id,
                 "name": notion_data["task_name"],
-                "description": self.blocks_to_description(blocks),
-                "priority": priority_map.get(notion_data["priority"], "MEDIUM"),
-                "status": status_map.get(notion_data["status"], "TODO"),
+                "description": self.get_notion_description(notion_data, workspace),
+                "priority": PRIORITY_N2M.get(notion_data["priority"], "MEDIUM"),
+                "status": STATUS_N2M.get(notion_data["status"], "TODO"),
                 "duration": self.convert_hours_to_minutes(notion_data["est_duration_hrs"]),
             }
 
@@ -1227,8 +1692,8 @@ class MotionNotionSync:
                 due_date = self.extract_due_date_start(notion_data["due_date"])
                 if due_date:
                     motion_task_data["dueDate"] = due_date
-                    self.logger.info(
-                        f"🔍 DEBUG - Motion task payload dueDate: {due_date}"
+                    self.logger.debug(
+                        "🔍 DEBUG - Motion task payload dueDate: %s", due_date
                     )
                 else:
                     # Default due date if none provided but auto-scheduling is enabled
@@ -1236,24 +1701,23 @@ class MotionNotionSync:
                         "%Y-%m-%d"
                     )
                     motion_task_data["dueDate"] = default_due
-                    self.logger.info(
-                        f"🔍 DEBUG - No valid due date extracted, defaulting to: {default_due}"
+                    self.logger.debug(
+                        "🔍 DEBUG - No valid due date extracted, defaulting to: %s",
+                        default_due,
                     )
             else:
                 # Default due date for auto-scheduled tasks
                 default_due = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
                 motion_task_data["dueDate"] = default_due
-                self.logger.info(
-                    f"🔍 DEBUG - No due_date in notion_data, defaulting to: {default_due}"
+                self.logger.debug(
+                    "🔍 DEBUG - No due_date in notion_data, defaulting to: %s",
+                    default_due,
                 )
 
             # Custom fields will be set after task creation via separate API call
 
             # Set auto-scheduling with proper deadline configuration
-            motion_task_data["autoScheduled"] = {
-                "schedule": "Work Hours",
-                "deadlineType": "SOFT"  # Set deadline type so Motion properly handles due dates
-            }
+            motion_task_data["autoScheduled"] = AUTO_SCHEDULED
 
             # Create Motion task
             motion_id = self.create_motion_task(motion_task_data)
@@ -1275,7 +1739,7 @@ class MotionNotionSync:
             return False
 
         except Exception as e:
-            self.logger.error(f"Failed to create Motion task from Notion: {e}")
+            self.logger.error("Failed to create Motion task from Notion: %s", e)
             return False
 
 
@@ -1285,112 +1749,86 @@ class MotionNotionSync:
         notion_data: Dict[str, Any],
         workspace: str,
         cached_motion_tasks_by_id: Optional[Dict[str, Dict[str, Any]]] = None,
-    ) -> bool:
-        """Update Motion task with Notion data (Notion owns all fields except status)."""
+    ) -> Optional[bool]:
+        """Update Motion task with Notion data (Notion owns all fields except status).
+
+        Returns True if Motion was updated (or the task recreated), False if
+        nothing needed changing and None on failure.
+        """
         try:
             # Use cached Motion task data when available to avoid unnecessary API calls
             if cached_motion_tasks_by_id and motion_id in cached_motion_tasks_by_id:
                 motion_task = cached_motion_tasks_by_id[motion_id]
-                self.logger.debug(f"Using cached Motion task data for {motion_id}")
+                self.logger.debug("Using cached Motion task data for %s", motion_id)
             else:
                 # Fallback to API call if not in cache
                 motion_task = self.get_motion_task(motion_id)
                 self.logger.debug(
-                    f"Fetched Motion task data via API for {motion_id} (cache miss)"
+                    "Fetched Motion task data via API for %s (cache miss)", motion_id
                 )
 
             if not motion_task:
                 self.logger.warning(
-                    f"Motion task {motion_id} not found - creating new task to replace orphaned reference"
+                    "Motion task %s not found - creating new task to replace orphaned reference",
+                    motion_id,
                 )
                 # Create a new Motion task since the old one doesn't exist
-                return self._create_motion_from_notion(notion_data, workspace)
+                return self._create_motion_from_notion(notion_data, workspace) or None
 
-            # Compare actual task properties to detect changes instead of timestamps
-            def normalize_for_comparison(value):
-                """Normalize values for comparison."""
-                if value is None:
-                    return ""
-                if isinstance(value, str):
-                    return value.strip()
-                return str(value)
-
-            def normalize_priority(priority):
-                """Normalize priority values for comparison."""
-                if priority is None:
-                    return "NONE"
-                return str(priority).upper()
-
-            def normalize_due_date(due_date):
-                """Normalize due date for comparison - extract just YYYY-MM-DD."""
-                if due_date is None:
-                    return None
-                # If it's a dict with 'start', extract the start date
-                if isinstance(due_date, dict) and "start" in due_date:
-                    due_date = due_date["start"]
-                # Extract just the date part (YYYY-MM-DD)
-                due_date_str = str(due_date)
-                if "T" in due_date_str:
-                    return due_date_str.split("T")[0]
-                return due_date_str
+            # Neither side edited since the last sync found them in agreement
+            seen = [notion_data.get("updated_at"), motion_task.get("updatedTime")]
+            if all(seen) and self._in_sync_edits.get(notion_data["id"]) == seen:
+                self.logger.debug(
+                    "⏭️ SKIPPING - Unchanged on both sides since last sync: %s",
+                    notion_data["task_name"],
+                )
+                return False
 
+            # Compare actual task properties to detect changes instead of timestamps
             # Get current Motion task properties
-            motion_name = normalize_for_comparison(motion_task.get("name", ""))
-            motion_priority = normalize_priority(motion_task.get("priority", "NONE"))
+            motion_name = _normalize_text(motion_task.get("name", ""))
+            motion_priority = _normalize_priority(motion_task.get("priority", "NONE"))
             motion_duration = motion_task.get("duration", 30)
-            motion_due_date = normalize_due_date(motion_task.get("dueDate"))
+            motion_due_date = _normalize_due_date(motion_task.get("dueDate"))
             # Get Notion properties for comparison
-            notion_name = normalize_for_comparison(notion_data.get("task_name", ""))
-            notion_priority = normalize_priority(notion_data.get("priority", "NONE"))
+            notion_name = _normalize_text(notion_data.get("task_name", ""))
+            notion_priority = _normalize_priority(notion_data.get("priority", "NONE"))
             # Convert Notion hours to minutes to match Motion's format
             notion_duration_hours = notion_data.get("est_duration_hrs", 1.0) or 1.0
             notion_duration = int(notion_duration_hours * 60)  # Convert to minutes
-            notion_due_date = normalize_due_date(notion_data.get("due_date"))
-
-            # Debug: Log values for comparison
-            self.logger.info(f"🔍 DEBUG comparison for {notion_data['task_name']}:")
-            self.logger.info(
-                f"  due_date: Motion='{motion_due_date}' vs Notion='{notion_due_date}'"
-            )
-            self.logger.info(
-                f"  duration: Motion={motion_duration}min vs Notion={notion_duration}min ({notion_duration_hours}hrs)"
-            )
+            notion_due_date = _normalize_due_date(notion_data.get("due_date"))
 
             # Check for differences (excluding description to avoid formatting noise)
-            changes = []
-            if motion_name != notion_name:
-                changes.append(f"name ('{motion_name}' → '{notion_name}')")
-            if motion_priority != notion_priority:
-                changes.append(f"priority ('{motion_priority}' → '{notion_priority}')")
-            if motion_duration != notion_duration:
-                changes.append(f"duration ({motion_duration} → {notion_duration})")
-            if motion_due_date != notion_due_date:
-                changes.append(f"due_date ('{motion_due_date}' → '{notion_due_date}')")
+            changes = [
+                (field, motion_value, notion_value)
+                for field, motion_value, notion_value in (
+                    ("name", motion_name, notion_name),
+                    ("priority", motion_priority, notion_priority),
+                    ("duration", motion_duration, notion_duration),
+                    ("due_date", motion_due_date, notion_due_date),
+                )
+                if motion_value != notion_value
+            ]
 
             if not changes:
-                self.logger.info(
-                    f"⏭️ SKIPPING - No changes detected for: {notion_data['task_name']}"
+                self.logger.debug(
+                    "⏭️ SKIPPING - No changes detected for: %s",
+                    notion_data["task_name"],
                 )
+                if all(seen) and not self.dry_run:
+                    self._in_sync_edits[notion_data["id"]] = seen
                 return False
             else:
                 self.logger.info(
-                    f"🔄 Motion task needs update: {notion_data['task_name']}"
+                    "🔄 Motion task needs update: %s", notion_data["task_name"]
                 )
-                for change in changes:
-                    self.logger.info(f"  📝 {change}")
-
-            # Get Notion blocks for description (expensive operation)
-            blocks = []
-            if notion_data["id"]:
-                blocks_response = self.workspace_clients[
-                    workspace
-                ].blocks.children.list(block_id=notion_data["id"])
-                blocks = blocks_response.get("results", [])
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    for field, motion_value, notion_value in changes:
+                        self.logger.debug(
+                            "  📝 %s ('%s' → '%s')", field, motion_value, notion_value
+                        )
 
             # Build update data - Notion always overwrites Motion fields
-            priority_map = self.get_priority_mapping()
-            status_map = self.get_status_mapping()
-
             # Always use Notion's status UNLESS Motion is completed
             motion_status_obj = motion_task.get("status", {})
             motion_status = (
@@ -1402,16 +1840,17 @@ class MotionNotionSync:
                 # Preserve Motion's completed status
                 final_status = "Completed"
                 self.logger.info(
-                    f"🔒 PRESERVING Motion completed status for: {notion_data['task_name']}"
+                    "🔒 PRESERVING Motion completed status for: %s",
+                    notion_data["task_name"],
                 )
             else:
                 # Use Notion's status for all other cases
-                final_status = status_map.get(notion_data["status"], "TODO")
+                final_status = STATUS_N2M.get(notion_data["status"], "TODO")
 
             updates = {
                 "name": notion_data["task_name"],
-                "description": self.blocks_to_description(blocks),
-                "priority": priority_map.get(notion_data["priority"], "MEDIUM"),
+                "description": self.get_notion_description(notion_data, workspace),
+                "priority": PRIORITY_N2M.get(notion_data["priority"], "MEDIUM"),
                 "status": final_status,
                 "duration": self.convert_hours_to_minutes(
                     notion_data["est_duration_hrs"]
@@ -1425,328 +1864,162 @@ class MotionNotionSync:
                     updates["dueDate"] = due_date
 
             # Set auto-scheduling with proper deadline configuration
-            updates["autoScheduled"] = {
-                "schedule": "Work Hours",
-                "deadlineType": "SOFT"  # Set deadline type so Motion properly handles due dates
-            }
+            updates["autoScheduled"] = AUTO_SCHEDULED
+
+            # Conflict policy: Notion owns every field above, so any Motion-side
+            # edit is overwritten. Completion is the exception; it flows back
+            # through the Motion → Notion completion sync.
+            # Motion PATCH is partial: only send fields that would change something
+            updates = self._patch_delta(motion_id, motion_task, updates)
+            if not updates:
+                self.logger.debug(
+                    "⏭️ SKIPPING - Motion already matches Notion: %s",
+                    notion_data["task_name"],
+                )
+                return False
 
             self.logger.info(
-                f"🔄 OVERWRITING Motion task from Notion: {notion_data['task_name']}"
+                "🔄 OVERWRITING Motion task from Notion: %s", notion_data["task_name"]
             )
-            return self.update_motion_task(motion_id, updates, workspace)
+            if not self.update_motion_task(motion_id, updates, workspace):
+                return None
+            self._record_patched(motion_id, updates)
+            return True
 
-        except requests.exceptions.RequestException as e:
-            if (
-                hasattr(e, "response")
-                and e.response is not None
-                and e.response.status_code == 404
-            ):
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 404:
                 self.logger.warning(
-                    f"Motion task {motion_id} not found - creating new task to replace orphaned reference"
+                    "Motion task %s not found - creating new task to replace orphaned reference",
+                    motion_id,
                 )
                 # Create a new Motion task since the old one doesn't exist
-                return self._create_motion_from_notion(notion_data, workspace)
-            else:
-                self.logger.error(f"Failed to update Motion task {motion_id}: {e}")
-                return False
+                return self._create_motion_from_notion(notion_data, workspace) or None
+            self.logger.error("Failed to update Motion task %s: %s", motion_id, e)
+            return None
         except Exception as e:
-            self.logger.error(f"Failed to update Motion task {motion_id}: {e}")
-            return False
+            self.logger.error("Failed to update Motion task %s: %s", motion_id, e)
+            return None
 
     def _update_notion_motion_id(self, notion_id: str, motion_id: str, workspace: str):
-        """Update Notion task with Motion ID - always in Hub."""
-        try:
-            # Motion IDs should only be stored in the Hub
-            hub_client = self.workspace_clients["Hub"]
-            hub_client.pages.update(
-                page_id=notion_id,
-                properties={
-                    "Motion ID": {"rich_text": [{"text": {"content": motion_id}}]}
-                },
-            )
-            self.logger.info(
-                f"✅ Updated Hub task {notion_id} with Motion ID {motion_id}"
-            )
-        except Exception as e:
-            self.logger.error(f"Failed to update Notion task with Motion ID: {e}")
-
-    def has_meaningful_changes(
-        self, motion_task: Dict[str, Any], notion_page: Dict[str, Any], workspace: str
-    ) -> bool:
-        """Check if Motion task has meaningful differences compared to Notion page."""
-        try:
-            # Get field mapping for this workspace
-            field_mapping = self.get_workspace_field_mapping(workspace)
-
-            # Get Motion values
-            motion_status = motion_task.get("status", {}).get("name", "")
-            motion_priority = motion_task.get("priority", "")
-            motion_duration = motion_task.get("duration", 0)  # in minutes
-            motion_due_date = motion_task.get("dueDate")
-
-            # Get Notion values
-            notion_props = notion_page["properties"]
-
-            # Status comparison
-            status_field = field_mapping.get("Status", "Status")
-            notion_status_prop = notion_props.get(status_field, {})
-            notion_status = ""
-            if notion_status_prop.get("status") and notion_status_prop["status"].get(
-                "name"
-            ):
-                notion_status = notion_status_prop["status"]["name"]
-
-            # Priority comparison
-            priority_field = field_mapping.get("Priority", "Priority")
-            notion_priority_prop = notion_props.get(priority_field, {})
-            notion_priority = ""
-            if notion_priority_prop.get("select") and notion_priority_prop[
-                "select"
-            ].get("name"):
-                notion_priority = notion_priority_prop["select"]["name"]
-
-            # Duration comparison (convert Motion minutes to Notion hours)
-            duration_field = field_mapping.get("Est Duration Hrs", "Est Duration Hrs")
-            notion_duration_prop = notion_props.get(duration_field, {})
-            notion_duration_hours = notion_duration_prop.get("number", 0) or 0
-            motion_duration_hours = self.convert_minutes_to_hours(motion_duration)
-
-            # Due date comparison (normalize timezone formats)
-            due_date_field = field_mapping.get("Due date", "Due date")
-            notion_due_prop = notion_props.get(due_date_field, {})
-            notion_due_date = None
-            if notion_due_prop.get("date") and notion_due_prop["date"].get("start"):
-                notion_due_date = notion_due_prop["date"]["start"]
-                # Normalize timezone format: convert +00:00 to Z for comparison
-                if notion_due_date and notion_due_date.endswith("+00:00"):
-                    notion_due_date = notion_due_date.replace("+00:00", "Z")
-
-            # Map Motion values to Notion format for comparison
-            priority_map = self.get_priority_mapping()
-            status_map = self.get_status_mapping()
-
-            mapped_motion_status = status_map.get(motion_status, motion_status)
-            mapped_motion_priority = priority_map.get(motion_priority, motion_priority)
-
-            # Check for differences
-            status_changed = mapped_motion_status != notion_status
-            priority_changed = mapped_motion_priority != notion_priority
-
-            duration_changed = (
-                abs(motion_duration_hours - notion_duration_hours) > 0.01
-            )  # Small tolerance
-            due_date_changed = motion_due_date != notion_due_date
-
-            if (
-                status_changed
-                or priority_changed
-                or duration_changed
-                or due_date_changed
-            ):
-                self.logger.info(f"📋 Changes detected in {motion_task['name']}:")
-                if status_changed:
-                    self.logger.info(
-                        f"   Status: '{notion_status}' → '{mapped_motion_status}'"
-                    )
-                if priority_changed:
-                    self.logger.info(
-                        f"   Priority: '{notion_priority}' → '{mapped_motion_priority}'"
-                    )
-                if duration_changed:
-                    self.logger.info(
-                        f"   Duration: {notion_duration_hours}h → {motion_duration_hours}h"
-                    )
-                if due_date_changed:
-                    self.logger.info(
-                        f"   Due date: '{notion_due_date}' → '{motion_due_date}'"
-                    )
-                return True
-            else:
-                self.logger.debug(f"No meaningful changes in {motion_task['name']}")
-                return False
-
-        except Exception as e:
-            self.logger.warning(
-                f"Error comparing task content, proceeding with update: {e}"
-            )
-            return True  # When in doubt, update
-
-    def has_notion_to_motion_changes(
-        self, notion_data: Dict[str, Any], motion_task: Dict[str, Any], workspace: str
-    ) -> bool:
-        """Check if Notion task has meaningful differences compared to Motion task."""
-        try:
-
-            # Get Notion values
-            notion_status = notion_data.get("status", "")
-            notion_priority = notion_data.get("priority", "")
-            notion_duration_hours = notion_data.get("est_duration_hrs", 1.0)
-            notion_due_date = notion_data.get("due_date")
-
-            if isinstance(notion_due_date, dict) and notion_due_date.get("start"):
-                notion_due_date = notion_due_date["start"]
-                # Normalize timezone format
-                if notion_due_date and notion_due_date.endswith("+00:00"):
-                    notion_due_date = notion_due_date.replace("+00:00", "Z")
-            notion_description = notion_data.get("description", "")
-
-            # Get Motion values (with debug logging)
-            motion_status = motion_task.get("status", {}).get("name", "")
-            motion_priority = motion_task.get("priority", "")
-            motion_duration_minutes = motion_task.get("duration", 0)
-            motion_due_date = motion_task.get("dueDate")
-            motion_description = motion_task.get("description", "")
-
-            # Convert Motion minutes to hours for comparison
-            motion_duration_hours = self.convert_minutes_to_hours(
-                motion_duration_minutes
-            )
-
-            # Normalize both values to a common format for comparison
-            # Motion → Common format
-            motion_status_normalized = motion_status.upper() if motion_status else ""
-            motion_priority_normalized = (
-                motion_priority.upper() if motion_priority else ""
-            )
-
-            # Notion → Common format
-            notion_status_map = {
-                "Todo": "TODO",
-                "Backlog": "TODO",
-                "In Progress": "IN_PROGRESS",
-                "Completed": "COMPLETED",
-            }
-            notion_priority_map = {
-                "Low": "LOW",
-                "Medium": "MEDIUM",
-                "High": "HIGH",
-                "ASAP": "ASAP",
-            }
-
-            notion_status_normalized = notion_status_map.get(
-                notion_status, notion_status.upper() if notion_status else ""
-            )
-            notion_priority_normalized = notion_priority_map.get(
-                notion_priority, notion_priority.upper() if notion_priority else ""
-            )
-
-            # Check for differences using normalized values (excluding description)
-            status_changed = notion_status_normalized != motion_status_normalized
-            priority_changed = notion_priority_normalized != motion_priority_normalized
-            duration_changed = abs(notion_duration_hours - motion_duration_hours) > 0.01
-            due_date_changed = notion_due_date != motion_due_date
-
-            # Debug: Always log the raw values being compared
-            self.logger.debug(
-                f"🔍 Notion→Motion comparison for {notion_data['task_name']}:"
-            )
-            self.logger.debug(
-                f"   Motion status: '{motion_status}' → normalized: '{motion_status_normalized}'"
-            )
-            self.logger.debug(
-                f"   Notion status: '{notion_status}' → normalized: '{notion_status_normalized}'"
-            )
-            self.logger.debug(
-                f"   Motion duration: {motion_duration_minutes} min ({motion_duration_hours}h)"
-            )
-            self.logger.debug(f"   Notion duration: {notion_duration_hours}h")
-            self.logger.debug(
-                f"   Changes: status={status_changed}, priority={priority_changed}, duration={duration_changed}"
-            )
-
-            if (
-                status_changed
-                or priority_changed
-                or duration_changed
-                or due_date_changed
-            ):
-                self.logger.info(f"📋 Changes detected in {notion_data['task_name']}:")
-                if status_changed:
-                    self.logger.info(
-                        f"   Status: '{motion_status}' ({motion_status_normalized}) → '{notion_status}' ({notion_status_normalized})"
-                    )
-                if priority_changed:
-                    self.logger.info(
-                        f"   Priority: '{motion_priority}' ({motion_priority_normalized}) → '{notion_priority}' ({notion_priority_normalized})"
-                    )
-                if duration_changed:
-                    self.logger.info(
-                        f"   Duration: {motion_duration_hours}h → {notion_duration_hours}h"
-                    )
-                if due_date_changed:
-                    self.logger.info(
-                        f"   Due date: '{motion_due_date}' → '{notion_due_date}'"
-                    )
+        """Queue a Motion ID write-back to the Hub (see flush_notion_motion_ids)."""
+        with self._pending_lock:
+            self._pending_motion_id_writes.append((notion_id, motion_id))
+
+    def flush_notion_motion_ids(self) -> int:
+        """Write queued Motion IDs to their Hub pages concurrently.
+
+        Returns the number of writes that failed.
+        """
+        with self._pending_lock:
+            pending = self._pending_motion_id_writes
+            self._pending_motion_id_writes = []
+        if not pending:
+            return 0
+
+        def write(notion_id: str, motion_id: str) -> bool:
+            try:
+                # Motion IDs should only be stored in the Hub
+                self.workspace_clients["Hub"].pages.update(
+                    page_id=notion_id,
+                    properties={
+                        "Motion ID": {"rich_text": [{"text": {"content": motion_id}}]}
+                    },
+                )
+                self.logger.info(
+                    "✅ Updated Hub task %s with Motion ID %s", notion_id, motion_id
+                )
                 return True
-            else:
-                self.logger.debug(
-                    f"No meaningful changes in {notion_data['task_name']}"
+            except Exception as e:
+                self.logger.error(
+                    "Failed to update Notion task %s with Motion ID: %s", notion_id, e
                 )
                 return False
 
-        except Exception as e:
-            self.logger.warning(
-                f"Error comparing Notion→Motion content, proceeding with update: {e}"
-            )
-            return True  # When in doubt, update
-
-    def set_notion_motion_sync_time(
-        self, notion_id: str, sync_time: str, workspace: str
-    ) -> bool:
-        """Set Notion 'Motion Last Sync' field to track when we last synced from Motion."""
-        if self.dry_run:
-            return True  # Skip in dry run
-
-        try:
-            # Update the Motion Last Sync field in the specified workspace
-            client = self.workspace_clients[workspace]
+        self.logger.info("📝 Writing %s Motion IDs back to Notion", len(pending))
+        return self._map_concurrently(write, *zip(*pending)).count(False)
 
-            # Get the field mapping for this workspace
-            field_mapping = self.get_workspace_field_mapping(workspace)
-            motion_sync_field = field_mapping.get(
-                "Motion Last Sync", "Motion Last Sync"
-            )
+    def sync_incremental(self, since: Optional[datetime] = None) -> Dict[str, Any]:
+        """Sync only tasks changed since the last successful sync (or ``since``)."""
+        return self.sync_full(incremental=True, since=since)
 
-            client.pages.update(
-                page_id=notion_id,
-                properties={motion_sync_field: {"date": {"start": sync_time}}},
-            )
-            self.logger.debug(
-                f"✅ Set Motion Last Sync time for Notion task {notion_id}"
-            )
-            return True
-        except Exception as e:
-            # Don't fail the whole sync if we can't set sync time - just log and continue
-            self.logger.debug(
-                f"Could not set Motion Last Sync time for Notion task {notion_id}: {e}"
-            )
-            return True  # Return True so sync continues
+    def sync_full(
+        self,
+        test_mode: bool = False,
+        incremental: bool = False,
+        since: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Perform full (or incremental) sync of all tasks.
 
-    def sync_full(self, test_mode: bool = False) -> Dict[str, Any]:
-        """Perform full sync of all tasks."""
-        mode_label = "TEST (1 task limit)" if test_mode else "FULL"
-        self.logger.info(f"🚀 Starting {mode_label} Motion ↔ Notion sync")
-        results = {"workspaces": {}}
+        Incremental runs use the per-direction watermarks saved by the last
+        successful sync; ``since`` overrides them with a fixed window.
+        """
+        if test_mode:
+            mode_label = "TEST (1 task limit)"
+        else:
+            mode_label = "INCREMENTAL" if incremental else "FULL"
+        self.logger.info("🚀 Starting %s Motion ↔ Notion sync", mode_label)
+        results = {"workspaces": {}, "totals": collections.Counter()}
 
         # Motion sync needs to check all Motion workspaces since tasks can be in any workspace
         # but Notion IDs are stored in Hub
         workspace = "Hub"
-        self.logger.info(f"🔄 Syncing Motion ↔ {workspace}")
-
-        # Get Motion tasks from ALL configured workspaces and combine them
-        all_motion_tasks = []
-        for ws_name, ws_id in self.motion_workspaces.items():
-            if ws_id:
-                self.logger.info(f"📊 Fetching Motion tasks from {ws_name} workspace")
-                ws_tasks = self.get_motion_tasks(ws_id)
+        self.logger.info("🔄 Syncing Motion ↔ %s", workspace)
+
+        # Capture the run start so edits made during the sync are picked up next run
+        sync_started_at = datetime.now(timezone.utc).isoformat()
+        motion_since = None
+        notion_since = None
+        if incremental and since:
+            motion_since = notion_since = since.astimezone(timezone.utc).isoformat()
+        elif incremental:
+            motion_since = self.get_last_sync(workspace, "motion_to_notion")
+            notion_since = self.get_last_sync(workspace, "notion_to_motion")
+        if incremental:
+            self.logger.info(
+                "📅 Last sync: Motion → Notion %s, Notion → Motion %s",
+                motion_since or "never",
+                notion_since or "never",
+            )
+
+        # The Motion workspaces and the Notion database are independent reads, so
+        # fetch them concurrently; Motion calls still share one rate limiter
+        motion_ws = {
+            name: ws_id for name, ws_id in self.motion_workspaces.items() if ws_id
+        }
+        with ThreadPoolExecutor(max_workers=len(motion_ws) + 1) as executor:
+            self.logger.info("📊 Fetching and caching Notion tasks from %s", workspace)
+            notion_future = executor.submit(
+                self.get_notion_tasks, workspace, since=notion_since
+            )
+            motion_futures = {}
+            for ws_name, ws_id in motion_ws.items():
+                self.logger.info("📊 Fetching Motion tasks from %s workspace", ws_name)
+                motion_futures[ws_name] = executor.submit(self.get_motion_tasks, ws_id)
+
+            # Combine Motion tasks from ALL configured workspaces. A failed fetch
+            # (already logged) would make its tasks look absent, so it aborts
+            # both directions rather than syncing against a partial picture
+            fetch_failed = False
+            all_motion_tasks = []
+            for ws_name, future in motion_futures.items():
+                try:
+                    ws_tasks = future.result()
+                except Exception:
+                    fetch_failed = True
+                    continue
                 all_motion_tasks.extend(ws_tasks)
                 self.logger.info(
-                    f"📊 Found {len(ws_tasks)} tasks in {ws_name} workspace"
+                    "📊 Found %s tasks in %s workspace", len(ws_tasks), ws_name
                 )
+            try:
+                notion_tasks_list = notion_future.result()
+            except Exception:
+                fetch_failed = True
+                notion_tasks_list = []
 
         motion_tasks = all_motion_tasks
         self.logger.info(
-            f"📊 Cached {len(motion_tasks)} Motion tasks total from all workspaces"
+            "📊 Cached %s Motion tasks total from all workspaces", len(motion_tasks)
         )
 
         # Create lookup dictionary by Motion ID for fast access
@@ -1755,51 +2028,96 @@ class MotionNotionSync:
         }
 
         workspace_results = {}
-        
-        # Fetch Notion tasks once and cache them to avoid redundant API calls
-        self.logger.info(f"📊 Fetching and caching Notion tasks from {workspace}")
-        notion_tasks_list = self.get_notion_tasks(workspace)
-        
+
         # Create lookup dictionary by Notion ID for fast access (for Motion → Notion sync)
         cached_notion_tasks_dict = {task.get("id"): task for task in notion_tasks_list if task.get("id")}
-        self.logger.info(f"📊 Cached {len(cached_notion_tasks_dict)} Notion tasks for optimization")
-
-        # Motion → Notion sync first (to capture user changes from Motion)
-        max_tasks = 1 if test_mode else None
-        workspace_results["motion_to_notion"] = self.sync_motion_to_notion(
-            workspace, max_tasks=max_tasks, cached_motion_tasks=motion_tasks, 
-            cached_notion_tasks=cached_notion_tasks_dict
-        )
-
-        # Get list of Notion IDs that were just processed by Motion → Notion
-        processed_notion_ids = workspace_results["motion_to_notion"].get(
-            "processed_notion_ids", []
+        self.logger.info(
+            "📊 Cached %s Notion tasks for optimization", len(cached_notion_tasks_dict)
         )
 
-        # Notion → Motion second (after Motion changes are synced to Notion)
-        # In test mode, limit to same task that was processed by Motion → Notion
-        if test_mode and workspace_results["motion_to_notion"].get(
-            "processed_notion_id"
-        ):
-            # Process only the same Notion task that Motion → Notion just processed
-            processed_id = workspace_results["motion_to_notion"]["processed_notion_id"]
-            workspace_results["notion_to_motion"] = self.sync_specific_notion_task(
-                workspace, processed_id, cached_motion_tasks_by_id=motion_tasks_by_id,
-                cached_notion_tasks_dict=cached_notion_tasks_dict
-            )
-        else:
-            # Skip tasks that were just processed by Motion → Notion to avoid overwriting changes
-            workspace_results["notion_to_motion"] = self.sync_notion_to_motion(
+        max_tasks = 1 if test_mode else None
+        if fetch_failed:
+            self.logger.error("❌ Skipping %s sync: could not fetch tasks", workspace)
+            workspace_results["motion_to_notion"] = {
+                "updated": 0,
+                "skipped": 0,
+                "errors": 1,
+            }
+            workspace_results["notion_to_motion"] = {
+                "created": 0,
+                "updated": 0,
+                "skipped": 0,
+                "errors": 1,
+            }
+        elif test_mode:
+            # Motion → Notion first, then Notion → Motion on the same task
+            workspace_results["motion_to_notion"] = self.sync_motion_to_notion(
                 workspace,
                 max_tasks=max_tasks,
-                skip_notion_ids=processed_notion_ids,
-                cached_motion_tasks_by_id=motion_tasks_by_id,
-                cached_notion_tasks=notion_tasks_list,
+                cached_motion_tasks=motion_tasks,
+                cached_notion_tasks=cached_notion_tasks_dict,
+                since=motion_since,
+            )
+            processed_id = workspace_results["motion_to_notion"].get(
+                "processed_notion_id"
             )
+            if processed_id:
+                # Process only the Notion task Motion → Notion just processed
+                workspace_results["notion_to_motion"] = self.sync_specific_notion_task(
+                    workspace,
+                    processed_id,
+                    cached_motion_tasks_by_id=motion_tasks_by_id,
+                    cached_notion_tasks_dict=cached_notion_tasks_dict,
+                )
+            else:
+                workspace_results["notion_to_motion"] = self.sync_notion_to_motion(
+                    workspace,
+                    max_tasks=max_tasks,
+                    cached_motion_tasks_by_id=motion_tasks_by_id,
+                    cached_notion_tasks=notion_tasks_list,
+                )
+        else:
+            # The pages Motion → Notion will touch are known up front, so keep
+            # Notion → Motion off them and run both directions concurrently; they
+            # mostly talk to different APIs and otherwise wait on each other
+            skip_notion_ids = list(
+                self._completed_by_notion_id(motion_tasks, motion_since)
+            )
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                motion_to_notion = executor.submit(
+                    self.sync_motion_to_notion,
+                    workspace,
+                    cached_motion_tasks=motion_tasks,
+                    cached_notion_tasks=cached_notion_tasks_dict,
+                    since=motion_since,
+                )
+                notion_to_motion = executor.submit(
+                    self.sync_notion_to_motion,
+                    workspace,
+                    skip_notion_ids=skip_notion_ids,
+                    cached_motion_tasks_by_id=motion_tasks_by_id,
+                    cached_notion_tasks=notion_tasks_list,
+                )
+                workspace_results["motion_to_notion"] = motion_to_notion.result()
+                workspace_results["notion_to_motion"] = notion_to_motion.result()
 
         results["workspaces"] = {workspace: workspace_results}
+        for stats in workspace_results.values():
+            results["totals"].update(
+                {k: v for k, v in stats.items() if isinstance(v, int)}
+            )
 
-        self.logger.info(f"✅ {mode_label} Motion ↔ Notion sync completed")
+        # Advance the watermarks only for directions that completed cleanly
+        if not test_mode:
+            for direction, stats in workspace_results.items():
+                if stats.get("errors", 0) == 0:
+                    self.set_last_sync(workspace, direction, sync_started_at)
+        # Only a full run sees every live page and task, so only it can prune
+        if not (test_mode or incremental or fetch_failed):
+            self._prune_state(cached_notion_tasks_dict, motion_tasks)
+        self._save_state()
+
+        self.logger.info("✅ %s Motion ↔ Notion sync completed", mode_label)
         return results
 
 
@@ -1809,9 +2127,15 @@ def main():
     )
     parser.add_argument(
         "--mode",
-        choices=["full", "test", "test-real"],
+        choices=["full", "incremental", "test", "test-real"],
         required=True,
-        help="Sync mode: full (all tasks), test (dry run), test-real (1 task real update)",
+        help="Sync mode: full (all tasks), incremental (changed since last sync), "
+        "test (dry run), test-real (1 task real update)",
+    )
+    parser.add_argument(
+        "--since-hours",
+        type=float,
+        help="Incremental mode: look back this many hours instead of the last sync",
     )
 
     args = parser.parse_args()
@@ -1819,42 +2143,47 @@ def main():
     try:
         # Initialize sync client
         dry_run = args.mode == "test"
-        sync_client = MotionNotionSync(dry_run=dry_run)
-
-        # Run sync based on mode
-        if args.mode == "full":
-            results = sync_client.sync_full()
-        elif args.mode == "test":
-            results = sync_client.sync_full(test_mode=True)
-        elif args.mode == "test-real":
-            results = sync_client.sync_full(test_mode=True)
-        else:
-            results = sync_client.sync_full()
+        with MotionNotionSync(dry_run=dry_run) as sync_client:
+            # Run sync based on mode
+            if args.mode == "full":
+                results = sync_client.sync_full()
+            elif args.mode == "incremental":
+                since = None
+                if args.since_hours:
+                    since = datetime.now(timezone.utc) - timedelta(
+                        hours=args.since_hours
+                    )
+                results = sync_client.sync_incremental(since=since)
+            elif args.mode in ("test", "test-real"):
+                # Same single-task run; only "test" is a dry run (see dry_run above)
+                results = sync_client.sync_full(test_mode=True)
+            else:
+                results = sync_client.sync_full()
 
         # Print summary
         print("\n" + "=" * 50)
         print("MOTION ↔ NOTION SYNC SUMMARY")
         print("=" * 50)
 
-        total_errors = 0
-        for workspace, workspace_results in results.get("workspaces", {}).items():
+        for workspace, workspace_results in results["workspaces"].items():
             print(f"\n{workspace}:")
-            notion_to_motion = workspace_results.get("notion_to_motion", {})
-            motion_to_notion = workspace_results.get("motion_to_notion", {})
-
-            print(
-                f"  Notion → Motion: {notion_to_motion.get('created', 0)} created, {notion_to_motion.get('updated', 0)} updated"
+            notion_to_motion = collections.Counter(
+                workspace_results.get("notion_to_motion", {})
+            )
+            motion_to_notion = collections.Counter(
+                workspace_results.get("motion_to_notion", {})
             )
-            print(f"  Motion → Notion: {motion_to_notion.get('updated', 0)} updated")
 
-            workspace_errors = notion_to_motion.get("errors", 0) + motion_to_notion.get(
-                "errors", 0
+            print(
+                f"  Notion → Motion: {notion_to_motion['created']} created, {notion_to_motion['updated']} updated"
             )
-            total_errors += workspace_errors
+            print(f"  Motion → Notion: {motion_to_notion['updated']} updated")
 
+            workspace_errors = notion_to_motion["errors"] + motion_to_notion["errors"]
             if workspace_errors > 0:
                 print(f"  ⚠️  Errors: {workspace_errors}")
 
+        total_errors = results["totals"]["errors"]
         if total_errors > 0:
             print(f"\n❌ Sync completed with {total_errors} errors")
             sys.exit(1)
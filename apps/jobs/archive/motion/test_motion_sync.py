@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Tests for the Motion ↔ Notion sync state handling.
+
+The API methods are stubbed on the instance, so nothing here talks to
+Motion or Notion.
+"""
+
+from contextlib import nullcontext
+
+import httpx
+import pytest
+import requests
+
+import motion_sync
+from motion_sync import BoundedClient, MotionNotionSync, SyncConfig
+
+CLEAN_STATS = {"updated": 0, "skipped": 0, "errors": 0}
+
+
+@pytest.fixture
+def sync(tmp_path, monkeypatch):
+    """A sync client built by the real __init__, with its task fetches stubbed.
+
+    The config is injected instead of read from the environment; creating the
+    HTTP clients makes no network calls.
+    """
+    config = SyncConfig(
+        motion_api_key="motion-key",
+        hub_token="hub-token",
+        hub_db_id="hub-db",
+        hub_user_id="hub-user",
+        hub_motion_workspace_id="ws-hub",
+        state_path=str(tmp_path / "state.json"),
+        max_workers=1,
+    )
+    monkeypatch.setattr(motion_sync, "load_config", lambda: config)
+    client = MotionNotionSync()
+    client.get_motion_tasks = lambda workspace_id: []
+    client.get_notion_tasks = lambda workspace, since=None: []
+    yield client
+    client.close()
+
+
+def fail(*args, **kwargs):
+    raise RuntimeError("API down")
+
+
+class FakeSession:
+    """Stands in for motion_session, replaying one outcome per request."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def request(self, method, url, data=None, timeout=None):
+        self.calls.append(method)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def close(self):
+        pass
+
+
+def response(status, headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update(headers or {})
+    resp._content = b'{"id": "m1"}'
+    return resp
+
+
+@pytest.fixture
+def waits(sync, monkeypatch):
+    """Sleeps taken between Motion retries, recorded instead of slept."""
+    recorded = []
+    monkeypatch.setattr(motion_sync.time, "sleep", recorded.append)
+    sync._wait_for_motion_rate_limit = lambda: None
+    return recorded
+
+
+def test_full_sync_advances_both_watermarks(sync, tmp_path):
+    """A clean run records its start time for both directions and saves it."""
+    sync.sync_motion_to_notion = lambda *args, **kwargs: dict(CLEAN_STATS)
+    sync.sync_notion_to_motion = lambda *args, **kwargs: dict(CLEAN_STATS)
+
+    results = sync.sync_full()
+
+    assert results["totals"]["errors"] == 0
+    assert sync.get_last_sync("Hub", "motion_to_notion")
+    assert sync.get_last_sync("Hub", "notion_to_motion")
+    assert (tmp_path / "state.json").exists()
+
+
+def test_watermark_holds_for_direction_with_errors(sync):
+    """Only the direction that finished cleanly moves its watermark."""
+    sync.sync_motion_to_notion = lambda *args, **kwargs: dict(CLEAN_STATS)
+    sync.sync_notion_to_motion = lambda *args, **kwargs: {**CLEAN_STATS, "errors": 1}
+
+    sync.sync_full()
+
+    assert sync.get_last_sync("Hub", "motion_to_notion")
+    assert sync.get_last_sync("Hub", "notion_to_motion") is None
+
+
+@pytest.mark.parametrize("failing_fetch", ["get_motion_tasks", "get_notion_tasks"])
+def test_fetch_failure_holds_watermarks(sync, failing_fetch):
+    """A failed task fetch is an error, not an empty workspace."""
+    setattr(sync, failing_fetch, fail)
+    sync.sync_motion_to_notion = sync.sync_notion_to_motion = fail
+
+    results = sync.sync_full()
+
+    assert results["totals"]["errors"] == 2
+    assert sync.get_last_sync("Hub", "motion_to_notion") is None
+    assert sync.get_last_sync("Hub", "notion_to_motion") is None
+
+
+def test_failed_motion_update_counts_as_error(sync):
+    """A rejected Motion PATCH is an error, not a skipped task."""
+    notion_data = {
+        "id": "p1",
+        "task_name": "Renamed",
+        "priority": "Medium",
+        "status": "Todo",
+        "est_duration_hrs": 1.0,
+        "due_date": None,
+        "updated_at": "2026-01-02T00:00:00.000Z",
+        "motion_id": "m1",
+    }
+    motion_task = {"id": "m1", "name": "Old", "priority": "MEDIUM", "duration": 60}
+    sync.extract_notion_task_data = lambda page: notion_data
+    sync.get_notion_description = lambda notion_data, workspace: ""
+    sync.update_motion_task = lambda *args: False
+
+    stats = sync.sync_notion_to_motion(
+        "Hub",
+        cached_motion_tasks_by_id={"m1": motion_task},
+        cached_notion_tasks=[{"id": "p1"}],
+    )
+
+    assert stats["errors"] == 1
+    assert stats["skipped"] == 0
+
+
+def test_failed_completion_write_counts_as_error(sync, monkeypatch):
+    """A Notion write that fails while pushing a completion is an error."""
+    motion_task = {
+        "id": "m1",
+        "name": "Done",
+        "status": {"name": "Completed"},
+        "customFieldValues": {"Notion ID": {"value": "p1"}},
+    }
+    sync.extract_notion_task_data = lambda page: {"status": "Todo", "task_name": "x"}
+    monkeypatch.setattr(sync.hub_client.pages, "update", fail)
+
+    stats = sync.sync_motion_to_notion(
+        "Hub", cached_motion_tasks=[motion_task], cached_notion_tasks={"p1": {}}
+    )
+
+    assert stats["errors"] == 1
+    assert stats["skipped"] == 0
+
+
+def test_failed_motion_id_write_back_counts_as_error(sync, monkeypatch):
+    """A created task whose Motion ID never reached Notion is an error."""
+
+    def create(notion_data, workspace):
+        sync._update_notion_motion_id(notion_data["id"], "m1", workspace)
+        return True
+
+    sync.extract_notion_task_data = lambda page: {"id": "p1", "task_name": "New"}
+    sync._create_motion_from_notion = create
+    monkeypatch.setattr(sync.hub_client.pages, "update", fail)
+
+    stats = sync.sync_notion_to_motion(
+        "Hub", cached_motion_tasks_by_id={}, cached_notion_tasks=[{"id": "p1"}]
+    )
+
+    assert stats["created"] == 1
+    assert stats["errors"] == 1
+
+
+def test_patch_delta_resends_field_changed_in_motion(sync):
+    """A Motion-side rename is overwritten even if we sent the name before."""
+    sync._record_patched("m1", {"name": "X"})
+
+    delta = sync._patch_delta("m1", {"name": "Y"}, {"name": "X"})
+
+    assert delta == {"name": "X"}
+
+
+def test_patch_delta_skips_matching_fields(sync):
+    """Fields Motion already holds are left out of the PATCH."""
+
+    delta = sync._patch_delta(
+        "m1",
+        {"name": "X", "dueDate": "2026-01-02T06:00:00.000Z"},
+        {"name": "X", "dueDate": "2026-01-02T06:00:00.000Z", "duration": 30},
+    )
+
+    assert delta == {"duration": 30}
+
+
+def test_patch_delta_trusts_last_sent_description(sync):
+    """Motion's reformatted description is not resent if Notion is unchanged."""
+    sync._record_patched("m1", {"description": "- [ ] item"})
+
+    unchanged = sync._patch_delta(
+        "m1", {"description": "<p>item</p>"}, {"description": "- [ ] item"}
+    )
+    edited = sync._patch_delta(
+        "m1", {"description": "<p>item</p>"}, {"description": "- [x] item"}
+    )
+
+    assert unchanged == {}
+    assert edited == {"description": "- [x] item"}
+
+
+def test_full_sync_prunes_state_for_vanished_ids(sync):
+    """Cached entries for pages and tasks no longer listed are dropped."""
+    completed = {
+        "id": "m2",
+        "status": {"name": "Completed"},
+        "customFieldValues": {"Notion ID": {"value": "p2"}},
+    }
+    sync.get_motion_tasks = lambda workspace_id: [{"id": "m1"}, completed]
+    sync.get_notion_tasks = lambda workspace, since=None: [{"id": "p1"}]
+    sync.sync_motion_to_notion = lambda *args, **kwargs: dict(CLEAN_STATS)
+    sync.sync_notion_to_motion = lambda *args, **kwargs: dict(CLEAN_STATS)
+    sync._description_cache.update(p1=["t", "kept"], gone=["t", "dropped"])
+    sync._in_sync_edits.update(p1=["a", "b"], gone=["a", "b"])
+    sync._completions.update(p2="t", gone="t")
+    sync._last_patched.update(m1={}, m2={}, gone={})
+
+    sync.sync_full()
+
+    assert set(sync._description_cache) == {"p1"}
+    assert set(sync._in_sync_edits) == {"p1"}
+    assert set(sync._completions) == {"p2"}
+    assert set(sync._last_patched) == {"m1", "m2"}
+
+
+def test_incremental_sync_keeps_state(sync):
+    """An incremental run only sees recent edits, so nothing is pruned."""
+    sync.sync_motion_to_notion = lambda *args, **kwargs: dict(CLEAN_STATS)
+    sync.sync_notion_to_motion = lambda *args, **kwargs: dict(CLEAN_STATS)
+    sync._description_cache["p1"] = ["t", "kept"]
+
+    sync.sync_incremental()
+
+    assert set(sync._description_cache) == {"p1"}
+
+
+@pytest.mark.parametrize(
+    "outcome", [response(500), requests.exceptions.Timeout("read timed out")]
+)
+def test_post_is_not_resent_after_server_error_or_timeout(sync, waits, outcome):
+    """A POST that may have been processed is not retried into a duplicate."""
+    sync.motion_session = FakeSession(outcome, response(200))
+
+    with pytest.raises(requests.exceptions.RequestException):
+        sync.motion_request("POST", "tasks", {"name": "New"})
+
+    assert sync.motion_session.calls == ["POST"]
+
+
+@pytest.mark.parametrize(
+    "method, outcome",
+    [
+        ("GET", response(503)),
+        ("PATCH", requests.exceptions.ConnectionError("reset")),
+    ],
+)
+def test_idempotent_request_is_retried(sync, waits, method, outcome):
+    """GETs and PATCHes are safe to resend after a transient failure."""
+    sync.motion_session = FakeSession(outcome, response(200))
+
+    result = sync.motion_request(method, "tasks/m1")
+
+    assert result == {"id": "m1"}
+    assert sync.motion_session.calls == [method, method]
+    assert len(waits) == 1
+
+
+def test_rate_limit_waits_for_retry_after(sync, waits):
+    """A 429 was never processed, so even a POST is resent after Retry-After."""
+    sync.motion_session = FakeSession(
+        response(429, {"Retry-After": "7"}), response(200)
+    )
+
+    result = sync.motion_request("POST", "tasks", {"name": "New"})
+
+    assert result == {"id": "m1"}
+    assert sync.motion_session.calls == ["POST", "POST"]
+    assert waits == [7.0]
+
+
+def test_notion_rate_limit_waits_for_retry_after(monkeypatch):
+    """A Notion 429 is retried once its Retry-After delay has passed."""
+    responses = [
+        httpx.Response(
+            429,
+            headers={"Retry-After": "2"},
+            json={
+                "object": "error",
+                "status": 429,
+                "code": "rate_limited",
+                "message": "slow",
+            },
+        ),
+        httpx.Response(200, json={"object": "page", "id": "p1"}),
+    ]
+    sent = []
+
+    def handle(request):
+        sent.append(request)
+        return responses[len(sent) - 1]
+
+    waits = []
+    monkeypatch.setattr(motion_sync.time, "sleep", waits.append)
+    client = BoundedClient(
+        api_slot=lambda api: nullcontext(),
+        rate_limit=1000,
+        auth="token",
+        client=httpx.Client(transport=httpx.MockTransport(handle)),
+    )
+
+    page = client.pages.retrieve(page_id="p1")
+
+    assert page["id"] == "p1"
+    assert len(sent) == 2
+    assert 2.0 in waits
@@ -22,17 +22,244 @@ Environment Variables Required:
     Examples:
     LIVEPEER_NOTION_API_KEY, LIVEPEER_NOTION_DB_ID, LIVEPEER_NOTION_USER_ID
     VANQUISH_NOTION_API_KEY, VANQUISH_NOTION_DB_ID, VANQUISH_NOTION_USER_ID
+
+Optional:
+    NOTION_SYNC_STATE_PATH - Last-sync state file (default: ~/.notion_sync_state.json)
 """
 
 import argparse
+import json
 import logging
 import os
+import random
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Set
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Set
 
+import httpx
 from dotenv import load_dotenv
-from notion_client import Client
+from notion_client import APIErrorCode, APIResponseError, Client
+from notion_client.helpers import collect_paginated_api
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+except ImportError:  # optional; Notion calls fall back to HTTP/1.1
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+logger = logging.getLogger(__name__)
+
+# Page updates in flight per workspace; this bounds concurrency, while
+# NOTION_RATE_LIMIT below bounds the request rate
+NOTION_MAX_WORKERS = 3
+
+# Notion's documented average limit, in requests per second per integration
+# token. The hub token is shared by every workspace synced in parallel
+NOTION_RATE_LIMIT = 3
+
+# Default attempts after the first for a rate_limited (429) response
+NOTION_MAX_RETRIES = 4
+
+# Keep-alive connections per client; the hub client is shared by every
+# workspace synced in parallel, so leave room above NOTION_MAX_WORKERS
+NOTION_POOL_SIZE = 20
+
+DEFAULT_STATE_PATH = "~/.notion_sync_state.json"
+
+# Statuses left out of normal queries. Notion has no "status is one of" filter,
+# so this stays an AND of does_not_equal clauses, built once
+EXCLUDED_STATUS_FILTER = {
+    "and": [
+        {"property": "Status", "status": {"does_not_equal": status}}
+        for status in ("Backlog", "Completed", "Canceled")
+    ]
+}
+
+# Task fields copied from the hub to external workspaces when they differ
+# (workspace-specific fields like Workspace and External Notion ID excluded)
+SYNC_FIELDS = (
+    "task_name",
+    "status",
+    "est_duration_hrs",
+    "due_date",
+    "priority",
+    "labels",
+    "team",
+)
+
+# Task field -> Notion property name, per workspace (anything unlisted uses Hub's)
+WORKSPACE_FIELD_MAPPINGS = {
+    "Vanquish": {
+        "est_duration_hrs": "Est. Duration Hrs",  # Note the period
+        "due_date": "Due Date",  # Note the capital D
+        "task_name": "Task name",
+        "status": "Status",
+        "priority": "Priority",
+        "external_notion_id": "External Notion ID",
+        "labels": "Labels",
+        "team": "Team",
+    },
+    "Hub": {
+        "est_duration_hrs": "Est Duration Hrs",
+        "due_date": "Due date",
+        "task_name": "Task name",
+        "status": "Status",
+        "priority": "Priority",
+        "external_notion_id": "External Notion ID",
+        "labels": "Labels",
+        "team": "Team",
+    },
+}
+
+
+def _external_notion_id(page: Dict[str, Any]) -> Optional[str]:
+    """Return the External Notion ID stored on a hub page, if it has one."""
+    prop = page.get("properties", {}).get("External Notion ID") or {}
+    rich_text = prop.get("rich_text") or ()
+    if not rich_text:
+        return None  # Hub-only tasks have no External Notion ID
+    return (rich_text[0].get("text") or {}).get("content") or None
+
+
+# Property readers for extract_task_data, defined once rather than per page
+def _get_text(prop_data: Optional[Dict[str, Any]]) -> str:
+    if not prop_data:
+        return ""
+    try:
+        if prop_data.get("type") == "title":
+            title_list = prop_data.get("title", [])
+            return "".join([t.get("plain_text", "") for t in title_list if t])
+        elif prop_data.get("type") == "rich_text":
+            rich_text_list = prop_data.get("rich_text", [])
+            return "".join([t.get("plain_text", "") for t in rich_text_list if t])
+        return ""
+    except (AttributeError, TypeError) as e:
+        logger.warning(f"⚠️ Error extracting text from property: {e}")
+        return ""
+
+
+def _get_select(prop_data: Optional[Dict[str, Any]]) -> Optional[str]:
+    if not prop_data or prop_data.get("type") != "select":
+        return None
+    select_data = prop_data.get("select")
+    value = select_data.get("name") if select_data else None
+    return value.strip() if value else None  # Strip whitespace
+
+
+def _get_status(prop_data: Optional[Dict[str, Any]]) -> Optional[str]:
+    if not prop_data or prop_data.get("type") != "status":
+        return None
+    status_data = prop_data.get("status")
+    return status_data.get("name") if status_data else None
+
+
+def _get_number(prop_data: Optional[Dict[str, Any]]) -> Optional[float]:
+    if not prop_data or prop_data.get("type") != "number":
+        return None
+    return prop_data.get("number")
+
+
+def _get_date(prop_data: Optional[Dict[str, Any]]) -> Optional[str]:
+    if not prop_data or prop_data.get("type") != "date":
+        return None
+    date_data = prop_data.get("date")
+    return date_data.get("start") if date_data else None
+
+
+def _get_multi_select(prop_data: Optional[Dict[str, Any]]) -> List[str]:
+    if not prop_data or prop_data.get("type") != "multi_select":
+        return []
+    multi_select_data = prop_data.get("multi_select", [])
+    return [item.get("name") for item in multi_select_data if item.get("name")]
+
+
+def _edited_since_filter(since_date: datetime) -> Dict[str, Any]:
+    """Notion timestamp filter for pages edited at or after since_date."""
+    return {
+        "timestamp": "last_edited_time",
+        "last_edited_time": {"on_or_after": since_date.isoformat()},
+    }
+
+
+def _retry_wait(
+    headers: Mapping[str, str], attempt: int, base: float, max_wait: float = 60
+) -> float:
+    """Seconds to wait before retrying: Retry-After if given, else backoff."""
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(float(retry_after), max_wait)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+
+    # Exponential backoff with equal jitter so parallel workers don't retry in sync
+    backoff = min(base * 2**attempt, max_wait)
+    return backoff / 2 + random.uniform(0, backoff / 2)
+
+
+class RateLimitedClient(Client):
+    """Notion client spaced to the per-token rate limit.
+
+    A ``rate_limited`` response is retried after its Retry-After delay, and
+    successful responses are decoded with orjson when it is installed.
+    """
+
+    def __init__(
+        self,
+        rate_limit: float = NOTION_RATE_LIMIT,
+        rate_limit_retries: int = NOTION_MAX_RETRIES,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self._rate_limit_retries = rate_limit_retries
+        # Shared by every thread using this client (one client per token)
+        self._min_interval = 1 / rate_limit
+        self._next_request_at = 0.0
+        self._rate_lock = threading.Lock()
+
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep until this client's next request slot under the rate limit."""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self._min_interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        for attempt in range(self._rate_limit_retries + 1):
+            self._wait_for_rate_limit()
+            try:
+                return super().request(*args, **kwargs)
+            except APIResponseError as e:
+                retries_left = attempt < self._rate_limit_retries
+                if e.code != APIErrorCode.RateLimited or not retries_left:
+                    raise
+                wait_time = _retry_wait(e.headers, attempt, base=1)
+                logger.warning(
+                    "⚠️ Notion API rate limit hit (attempt %s/%s), waiting %.1fs...",
+                    attempt + 1,
+                    self._rate_limit_retries + 1,
+                    wait_time,
+                )
+                time.sleep(wait_time)
+
+    def _parse_response(self, response: httpx.Response) -> Any:
+        # Query pages are large; leave error responses to the SDK so its
+        # APIResponseError mapping still applies
+        if orjson is not None and response.is_success:
+            return orjson.loads(response.content)
+        return super()._parse_response(response)
 
 
 class NotionTaskSync:
@@ -114,7 +341,7 @@ class NotionTaskSync:
 
         # Check if sync is needed
         if self.blocks_are_equal(source_blocks, target_blocks):
-            self.logger.debug(f"📝 Blocks already in sync for {target_page_id}")
+            self.logger.debug("📝 Blocks already in sync for %s", target_page_id)
             return False
 
         if self.dry_run:
@@ -192,6 +419,15 @@ class NotionTaskSync:
         load_dotenv(".env")
         self.dry_run = dry_run
 
+        # Last successful sync time per workspace, for incremental runs
+        self.state_path = Path(
+            os.getenv("NOTION_SYNC_STATE_PATH", DEFAULT_STATE_PATH)
+        ).expanduser()
+        self._state = self._load_state()
+
+        # Page ID -> (last_edited_time, extract_task_data result)
+        self._extracted: Dict[str, Any] = {}
+
         # Initialize hub workspace
         self._init_hub_workspace()
 
@@ -223,7 +459,18 @@ class NotionTaskSync:
             )
 
         # Initialize hub client
-        self.hub_client = Client(auth=self.hub_token)
+        self.hub_client = self._new_client(self.hub_token)
+
+    def _new_client(self, token: str) -> RateLimitedClient:
+        """Create a Notion client that keeps its connections alive between calls."""
+        http = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=NOTION_POOL_SIZE,
+                max_keepalive_connections=NOTION_POOL_SIZE,
+            ),
+        )
+        return RateLimitedClient(auth=token, client=http)
 
     def _discover_workspaces(self):
         """Auto-discover external workspaces from environment variables."""
@@ -254,7 +501,7 @@ class NotionTaskSync:
                     }
 
                     # Initialize client and store references
-                    self.workspace_clients[workspace_name] = Client(auth=api_key)
+                    self.workspace_clients[workspace_name] = self._new_client(api_key)
                     self.workspace_databases[workspace_name] = value
                     self.workspace_user_ids[workspace_name] = user_id
 
@@ -279,6 +526,38 @@ class NotionTaskSync:
             f"✅ Initialized {workspace_count} external workspaces: {list(self.workspaces.keys())}"
         )
 
+    def _load_state(self) -> Dict[str, Any]:
+        """Load the sync state file, starting fresh if it is missing or corrupt."""
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return {"last_sync": {}}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"⚠️ Could not read sync state, starting over: {e}")
+            return {"last_sync": {}}
+        state.setdefault("last_sync", {})
+        return state
+
+    def _save_state(self):
+        """Write the sync state atomically so a crash never leaves it half-written."""
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(self._state, f, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            self.logger.warning(f"⚠️ Could not save sync state: {e}")
+
+    def get_last_sync(self, workspace: str) -> Optional[datetime]:
+        """Return when the workspace last synced cleanly, if ever."""
+        last_sync = self._state["last_sync"].get(workspace)
+        return datetime.fromisoformat(last_sync) if last_sync else None
+
+    def set_last_sync(self, workspace: str, sync_time: datetime):
+        """Record a clean sync of the workspace (saved by _save_state)."""
+        self._state["last_sync"][workspace] = sync_time.isoformat()
+
     def get_workspace_databases(self) -> Dict[str, str]:
         """Return mapping of workspace names to database IDs (excluding Hub)."""
         return {name: self.workspace_databases[name] for name in self.workspaces.keys()}
@@ -299,28 +578,7 @@ class NotionTaskSync:
 
     def get_workspace_field_mapping(self, workspace: str) -> Dict[str, str]:
         """Return field name mappings for each workspace."""
-        if workspace == "Vanquish":
-            return {
-                "est_duration_hrs": "Est. Duration Hrs",  # Note the period
-                "due_date": "Due Date",  # Note the capital D
-                "task_name": "Task name",
-                "status": "Status",
-                "priority": "Priority",
-                "external_notion_id": "External Notion ID",
-                "labels": "Labels",
-                "team": "Team",
-            }
-        else:
-            return {
-                "est_duration_hrs": "Est Duration Hrs",
-                "due_date": "Due date",
-                "task_name": "Task name",
-                "status": "Status",
-                "priority": "Priority",
-                "external_notion_id": "External Notion ID",
-                "labels": "Labels",
-                "team": "Team",
-            }
+        return WORKSPACE_FIELD_MAPPINGS.get(workspace, WORKSPACE_FIELD_MAPPINGS["Hub"])
 
     def query_assigned_tasks(
         self, database_id: str, workspace: str, since_date: Optional[datetime] = None
@@ -347,6 +605,9 @@ class NotionTaskSync:
             assigned_only: If True, only get tasks assigned to user. If False, get all tasks.
             since_date: Only get tasks updated since this date (for incremental sync)
             include_completed: If True, include completed/backlog/canceled tasks. If False, exclude them.
+
+        Query errors are logged and re-raised; an empty list would look like a
+        workspace with no tasks.
         """
         user_id = self.get_workspace_user_id(workspace)
         filter_conditions = {"and": []}
@@ -360,18 +621,11 @@ class NotionTaskSync:
         
         # Exclude completed statuses unless explicitly requested
         if not include_completed:
-            filter_conditions["and"].append({
-                "and": [
-                    {"property": "Status", "status": {"does_not_equal": "Backlog"}},
-                    {"property": "Status", "status": {"does_not_equal": "Completed"}},
-                    {"property": "Status", "status": {"does_not_equal": "Canceled"}},
-                ]
-            })
+            filter_conditions["and"].append(EXCLUDED_STATUS_FILTER)
 
-        # Note: since_date filtering is not implemented due to Notion API limitations
-        # The "Last edited time" property cannot be used in database queries
+        # Incremental: only pages edited since the last sync
         if since_date:
-            self.logger.debug(f"Date filtering skipped (since_date: {since_date})")
+            filter_conditions["and"].append(_edited_since_filter(since_date))
 
         try:
             client = self.get_workspace_client(workspace)
@@ -380,10 +634,13 @@ class NotionTaskSync:
                 self.logger.info(f"🔍 Filter for {workspace}: {filter_conditions}")
                 self.logger.info(f"🔍 Using User ID: {user_id}")
 
-            response = client.databases.query(
-                database_id=database_id, filter=filter_conditions
+            # Notion returns at most 100 rows per call; follow next_cursor for all
+            results = collect_paginated_api(
+                client.databases.query,
+                database_id=database_id,
+                filter=filter_conditions,
+                page_size=100,
             )
-            results = response.get("results", [])
 
             if self.dry_run:
                 self.logger.info(
@@ -432,7 +689,7 @@ class NotionTaskSync:
             return results
         except Exception as e:
             self.logger.error(f"Error querying database {database_id}: {e}")
-            return []
+            raise
 
     def query_hub_tasks(
         self, workspace: str = None, since_date: Optional[datetime] = None
@@ -443,6 +700,8 @@ class NotionTaskSync:
         Args:
             workspace: Filter by workspace (external workspace name, or None for all)
             since_date: Only get tasks updated since this date
+
+        Query errors are logged and re-raised.
         """
         filter_conditions = {"and": []}
 
@@ -453,92 +712,59 @@ class NotionTaskSync:
                 {"property": "Workspace", "select": {"equals": workspace.title()}}
             )
 
-        # Note: since_date filtering is not implemented due to Notion API limitations
-        # The "Last edited time" property cannot be used in database queries
+        # Incremental: only pages edited since the last sync
         if since_date:
-            self.logger.debug(f"Date filtering skipped (since_date: {since_date})")
+            filter_conditions["and"].append(_edited_since_filter(since_date))
 
         # If no conditions, query all
         query_filter = filter_conditions if filter_conditions["and"] else None
 
         try:
-            response = self.hub_client.databases.query(
-                database_id=self.hub_db_id, filter=query_filter
+            return collect_paginated_api(
+                self.hub_client.databases.query,
+                database_id=self.hub_db_id,
+                filter=query_filter,
+                page_size=100,
             )
-            return response.get("results", [])
         except Exception as e:
             self.logger.error(f"Error querying hub: {e}")
-            return []
+            raise
 
     def extract_task_data(self, page: Dict) -> Dict[str, Any]:
-        """Extract standardized task data from a Notion page."""
-        props = page.get("properties", {})
+        """Extract standardized task data from a Notion page.
 
-        # Debug: Log available properties
-        if self.dry_run:
-            self.logger.debug(f"🔍 Available properties: {list(props.keys())}")
+        Hub pages are queried once per sync direction, so results are cached by
+        page ID and reused while last_edited_time is unchanged. Treat the
+        returned dict as read-only.
+        """
+        page_id = page.get("id")
+        edited = page.get("last_edited_time")
+        cached = self._extracted.get(page_id)
+        if cached and edited and cached[0] == edited:
+            return cached[1]
 
-        def get_text(prop_data):
-            if not prop_data:
-                return ""
-            try:
-                if prop_data.get("type") == "title":
-                    title_list = prop_data.get("title", [])
-                    return "".join([t.get("plain_text", "") for t in title_list if t])
-                elif prop_data.get("type") == "rich_text":
-                    rich_text_list = prop_data.get("rich_text", [])
-                    return "".join(
-                        [t.get("plain_text", "") for t in rich_text_list if t]
-                    )
-                return ""
-            except (AttributeError, TypeError) as e:
-                self.logger.warning(f"⚠️ Error extracting text from property: {e}")
-                return ""
-
-        def get_select(prop_data):
-            if not prop_data or prop_data.get("type") != "select":
-                return None
-            select_data = prop_data.get("select")
-            value = select_data.get("name") if select_data else None
-            return value.strip() if value else None  # Strip whitespace
-
-        def get_status(prop_data):
-            if not prop_data or prop_data.get("type") != "status":
-                return None
-            status_data = prop_data.get("status")
-            return status_data.get("name") if status_data else None
-
-        def get_number(prop_data):
-            if not prop_data or prop_data.get("type") != "number":
-                return None
-            return prop_data.get("number")
-
-        def get_date(prop_data):
-            if not prop_data or prop_data.get("type") != "date":
-                return None
-            date_data = prop_data.get("date")
-            return date_data.get("start") if date_data else None
-
-        def get_multi_select(prop_data):
-            if not prop_data or prop_data.get("type") != "multi_select":
-                return []
-            multi_select_data = prop_data.get("multi_select", [])
-            return [item.get("name") for item in multi_select_data if item.get("name")]
-
-        return {
-            "id": page.get("id"),
-            "task_name": get_text(props.get("Task name")),
-            "status": get_status(props.get("Status")),
-            "workspace": get_select(props.get("Workspace")),
-            "est_duration_hrs": get_number(props.get("Est Duration Hrs")),
-            "due_date": get_date(props.get("Due date")),
-            "priority": get_select(props.get("Priority")),
-            "external_notion_id": get_text(props.get("External Notion ID")),
-            "labels": get_multi_select(props.get("Labels")),
-            "team": get_select(props.get("Team")),
-            "updated_at": page.get("last_edited_time"),
+        props = page.get("properties", {})
+
+        # Debug: Log available properties (skip building the list unless enabled)
+        if self.dry_run and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("🔍 Available properties: %s", list(props.keys()))
+
+        task_data = {
+            "id": page_id,
+            "task_name": _get_text(props.get("Task name")),
+            "status": _get_status(props.get("Status")),
+            "workspace": _get_select(props.get("Workspace")),
+            "est_duration_hrs": _get_number(props.get("Est Duration Hrs")),
+            "due_date": _get_date(props.get("Due date")),
+            "priority": _get_select(props.get("Priority")),
+            "external_notion_id": _get_text(props.get("External Notion ID")),
+            "labels": _get_multi_select(props.get("Labels")),
+            "team": _get_select(props.get("Team")),
+            "updated_at": edited,
             "url": page.get("url"),
         }
+        self._extracted[page_id] = (edited, task_data)
+        return task_data
 
     def create_task_in_hub(
         self, task_data: Dict, workspace: str, external_id: str, sync_content: bool = True
@@ -690,6 +916,21 @@ class NotionTaskSync:
             self.logger.error(f"❌ Error updating task {page_id}: {e}")
             return False
 
+    def batch_update_tasks(self, updates: List[Dict[str, Any]]) -> List[bool]:
+        """Apply several update_task_properties calls concurrently.
+
+        Each item holds the keyword arguments for one update_task_properties
+        call; results come back in the same order.
+        """
+        if len(updates) <= 1:
+            return [self.update_task_properties(**update) for update in updates]
+        with ThreadPoolExecutor(max_workers=NOTION_MAX_WORKERS) as executor:
+            return list(
+                executor.map(
+                    lambda update: self.update_task_properties(**update), updates
+                )
+            )
+
     def create_task_in_external_workspace(
         self, task_data: Dict, workspace: str, database_id: str
     ) -> Optional[str]:
@@ -754,43 +995,25 @@ class NotionTaskSync:
         stats = {"created": 0, "updated": 0, "skipped": 0, "errors": 0}
         workspace_db_id = self.get_workspace_databases()[workspace]
 
-        # Get tasks from external workspace
-        external_tasks = self.query_assigned_tasks(
-            workspace_db_id, workspace, since_date
-        )
-
-        # Get existing hub tasks for this workspace
-        hub_tasks = self.query_hub_tasks(workspace, since_date)
-        external_id_map = {}
-
-        for task in hub_tasks:
-            try:
-                # Safely extract External Notion ID
-                props = task.get("properties", {})
-                external_id_prop = props.get("External Notion ID", {})
-                rich_text = external_id_prop.get("rich_text", [])
-
-                if rich_text and len(rich_text) > 0:
-                    text_obj = rich_text[0].get("text", {})
-                    external_id = text_obj.get("content", "")
-                    if external_id:
-                        external_id_map[external_id] = task
-                else:
-                    # Task doesn't have External Notion ID - that's fine for personal tasks
-                    pass
+        try:
+            # Get tasks from external workspace
+            external_tasks = self.query_assigned_tasks(
+                workspace_db_id, workspace, since_date
+            )
 
-            except Exception as e:
-                task_name = (
-                    task.get("properties", {}).get("Task name", {}).get("title", [{}])
-                )
-                task_title = (
-                    task_name[0].get("plain_text", "Unknown")
-                    if task_name
-                    else "Unknown"
-                )
-                self.logger.warning(
-                    f"⚠️ Could not extract External ID from task '{task_title}': {e}"
-                )
+            # Get ALL existing hub tasks for this workspace (not just recent ones),
+            # so an old linked task is never mistaken for a new one
+            hub_tasks = self.query_hub_tasks(workspace)
+        except Exception:
+            # Already logged; without the hub tasks every external task would
+            # look new and be duplicated
+            stats["errors"] += 1
+            return stats
+        external_id_map = {
+            external_id: task
+            for task in hub_tasks
+            if (external_id := _external_notion_id(task))
+        }
 
         self.logger.info(
             f"📊 Found {len(external_tasks)} external tasks in {workspace}"
@@ -802,7 +1025,8 @@ class NotionTaskSync:
                 external_data = self.extract_task_data(external_task)
                 external_id = external_data["id"]
                 self.logger.debug(
-                    f"🔍 Processing external task: {external_data.get('task_name', 'Unknown')}"
+                    "🔍 Processing external task: %s",
+                    external_data.get("task_name", "Unknown"),
                 )
             except Exception as e:
                 self.logger.error(f"❌ Error extracting data from external task: {e}")
@@ -847,16 +1071,25 @@ class NotionTaskSync:
         """Sync tasks from hub back to external workspace."""
         self.logger.info(f"🔄 Syncing Hub → {workspace}")
 
-        stats = {"updated": 0, "skipped": 0, "errors": 0}
+        # "missing" counts hub tasks whose linked page is gone; rerunning cannot
+        # fix those, so unlike errors they don't hold back the watermark
+        stats = {"updated": 0, "skipped": 0, "missing": 0, "errors": 0}
         workspace_db_id = self.get_workspace_databases()[workspace]
 
-        # Get hub tasks for this workspace
-        hub_tasks = self.query_hub_tasks(workspace, since_date)
-        
-        # OPTIMIZATION: Bulk fetch all external tasks upfront to avoid individual API calls
-        # Include completed tasks to handle hub→external status syncing (e.g. completed tasks)
-        self.logger.info(f"📦 Bulk fetching external tasks from {workspace} (including completed)...")
-        all_external_tasks = self.query_workspace_tasks(workspace_db_id, workspace, assigned_only=False, since_date=since_date, include_completed=True)
+        try:
+            # Get hub tasks for this workspace
+            hub_tasks = self.query_hub_tasks(workspace, since_date)
+
+            # OPTIMIZATION: Bulk fetch all external tasks upfront to avoid individual API calls
+            # Include completed tasks to handle hub→external status syncing (e.g. completed tasks)
+            self.logger.info(f"📦 Bulk fetching external tasks from {workspace} (including completed)...")
+            # Not limited by since_date: a recently edited hub task may link to an old page
+            all_external_tasks = self.query_workspace_tasks(
+                workspace_db_id, workspace, assigned_only=False, include_completed=True
+            )
+        except Exception:
+            stats["errors"] += 1  # Already logged; the watermark stays put
+            return stats
         
         # Create mapping of external_id -> external_task_data for fast lookup
         external_tasks_map = {}
@@ -865,6 +1098,10 @@ class NotionTaskSync:
         
         self.logger.info(f"📦 Cached {len(external_tasks_map)} external tasks from {workspace}")
 
+        # Property/content updates are independent, so collect them and send
+        # them concurrently after the loop instead of one round-trip at a time
+        pending_updates = []
+
         for hub_task in hub_tasks:
             hub_data = self.extract_task_data(hub_task)
             external_id = hub_data["external_notion_id"]
@@ -879,16 +1116,20 @@ class NotionTaskSync:
                         hub_data, workspace, workspace_db_id
                     )
                     if new_external_id:
-                        # Update hub task with the new External Notion ID
-                        self.update_task_properties(
+                        # Update hub task with the new External Notion ID; an
+                        # unlinked hub task would be duplicated by External → Hub
+                        linked = self.update_task_properties(
                             hub_task["id"],
                             {"external_notion_id": new_external_id},
                             "Hub",
                         )
-                        stats["updated"] += 1
-                        self.logger.info(
-                            f"✅ Created and linked task: {hub_data['task_name']}"
-                        )
+                        if linked:
+                            stats["updated"] += 1
+                            self.logger.info(
+                                f"✅ Created and linked task: {hub_data['task_name']}"
+                            )
+                        else:
+                            stats["errors"] += 1
                     else:
                         stats["errors"] += 1
                 except Exception as e:
@@ -901,7 +1142,7 @@ class NotionTaskSync:
                 external_data = external_tasks_map.get(external_id)
                 if not external_data:
                     self.logger.warning(f"⚠️ External task {external_id} not found in {workspace} (may have been deleted)")
-                    stats["errors"] += 1
+                    stats["missing"] += 1
                     continue
 
                 # Check if sync is needed based on updated_at timestamp
@@ -926,32 +1167,18 @@ class NotionTaskSync:
                             external_dt = external_updated
                         needs_sync = hub_dt > external_dt
                     except Exception as e:
-                        self.logger.debug(f"Error comparing timestamps: {e}")
+                        self.logger.debug("Error comparing timestamps: %s", e)
                         needs_sync = True  # Fallback to full sync
                 else:
                     needs_sync = True  # Missing timestamps, do full sync
 
                 if needs_sync:
-                    updates = {}
-
-                    # Compare fields and build updates (exclude workspace-specific fields)
-                    if hub_data["task_name"] != external_data["task_name"]:
-                        updates["task_name"] = hub_data["task_name"]
-                    if hub_data["status"] != external_data["status"]:
-                        updates["status"] = hub_data["status"]
-                    if (
-                        hub_data["est_duration_hrs"]
-                        != external_data["est_duration_hrs"]
-                    ):
-                        updates["est_duration_hrs"] = hub_data["est_duration_hrs"]
-                    if hub_data["due_date"] != external_data["due_date"]:
-                        updates["due_date"] = hub_data["due_date"]
-                    if hub_data["priority"] != external_data["priority"]:
-                        updates["priority"] = hub_data["priority"]
-                    if hub_data["labels"] != external_data["labels"]:
-                        updates["labels"] = hub_data["labels"]
-                    if hub_data["team"] != external_data["team"]:
-                        updates["team"] = hub_data["team"]
+                    # Compare fields and build updates
+                    updates = {
+                        field: hub_data[field]
+                        for field in SYNC_FIELDS
+                        if hub_data[field] != external_data[field]
+                    }
 
                     if updates:
                         # There are actual property changes to sync
@@ -970,17 +1197,17 @@ class NotionTaskSync:
                                 )
                             stats["updated"] += 1
                         else:
-                            if self.update_task_properties(
-                                external_id,
-                                updates,
-                                workspace,
-                                sync_content=True,  # Always sync content from hub to external
-                                source_page_id=hub_task["id"],
-                                source_workspace="Hub",
-                            ):
-                                stats["updated"] += 1
-                            else:
-                                stats["errors"] += 1
+                            pending_updates.append(
+                                {
+                                    "page_id": external_id,
+                                    "updates": updates,
+                                    "workspace": workspace,
+                                    # Always sync content from hub to external
+                                    "sync_content": True,
+                                    "source_page_id": hub_task["id"],
+                                    "source_workspace": "Hub",
+                                }
+                            )
                     else:  # Always sync content from hub to external
                         # No property changes, but always sync content from hub - check if content differs
                         if self.dry_run:
@@ -1000,17 +1227,16 @@ class NotionTaskSync:
                             )
 
                             if not self.blocks_are_equal(hub_blocks, external_blocks):
-                                if self.update_task_properties(
-                                    external_id,
-                                    {},
-                                    workspace,
-                                    sync_content=True,
-                                    source_page_id=hub_task["id"],
-                                    source_workspace="Hub",
-                                ):
-                                    stats["updated"] += 1
-                                else:
-                                    stats["errors"] += 1
+                                pending_updates.append(
+                                    {
+                                        "page_id": external_id,
+                                        "updates": {},
+                                        "workspace": workspace,
+                                        "sync_content": True,
+                                        "source_page_id": hub_task["id"],
+                                        "source_workspace": "Hub",
+                                    }
+                                )
                             else:
                                 stats["skipped"] += 1
                 else:
@@ -1026,41 +1252,82 @@ class NotionTaskSync:
                 )
                 stats["errors"] += 1
 
+        for updated in self.batch_update_tasks(pending_updates):
+            stats["updated" if updated else "errors"] += 1
+
         self.logger.info(f"📊 {workspace} reverse sync complete: {stats}")
         return stats
 
-    def sync_full(self, sync_content: bool = False) -> Dict[str, Any]:
-        """Perform full sync of all tasks."""
-        self.logger.info("🚀 Starting FULL sync")
-        results = {"workspaces": {}}
-
-        for workspace in self.get_workspace_databases().keys():
-            workspace_results = {}
+    def sync_full(
+        self, sync_content: bool = False, incremental: bool = False
+    ) -> Dict[str, Any]:
+        """Perform full (or incremental) sync of all tasks.
 
-            # External → Hub
-            workspace_results["external_to_hub"] = self.sync_external_to_hub(
-                workspace, sync_content=sync_content
-            )
+        Incremental runs only query pages edited since each workspace's last
+        clean sync; workspaces that never synced get a full pass.
+        """
+        mode_label = "INCREMENTAL" if incremental else "FULL"
+        self.logger.info(f"🚀 Starting {mode_label} sync")
+        results = {"workspaces": {}}
 
-            # Hub → External
-            workspace_results["hub_to_external"] = self.sync_hub_to_external(
-                workspace, sync_content=sync_content
-            )
+        # Sync external workspaces side by side; the two directions within a
+        # workspace stay in order. Their hub calls share the hub client, whose
+        # rate limiter keeps the combined traffic within the hub token's limit
+        workspaces = list(self.get_workspace_databases().keys())
+        if len(workspaces) > 1:
+            with ThreadPoolExecutor(max_workers=len(workspaces)) as executor:
+                futures = {
+                    workspace: executor.submit(
+                        self._sync_workspace, workspace, sync_content, incremental
+                    )
+                    for workspace in workspaces
+                }
+                for workspace, future in futures.items():
+                    results["workspaces"][workspace] = future.result()
+        else:
+            for workspace in workspaces:
+                results["workspaces"][workspace] = self._sync_workspace(
+                    workspace, sync_content, incremental
+                )
 
-            results["workspaces"][workspace] = workspace_results
+        if not self.dry_run:
+            self._save_state()
 
-        self.logger.info("✅ Full sync completed")
+        self.logger.info(f"✅ {mode_label.title()} sync completed")
         return results
 
-    def sync_incremental(self, sync_content: bool = False) -> Dict[str, Any]:
-        """Perform incremental sync - currently same as full sync due to Notion API limitations."""
-        self.logger.info("🚀 Starting INCREMENTAL sync (falling back to full sync)")
-        self.logger.warning(
-            "⚠️  Note: Incremental sync requires custom timestamp fields. Using full sync for now."
+    def _sync_workspace(
+        self, workspace: str, sync_content: bool, incremental: bool = False
+    ) -> Dict[str, Any]:
+        """Run both sync directions for one external workspace."""
+        workspace_results = {}
+
+        # Capture the start so edits made during the run are picked up next time
+        sync_started_at = datetime.now(timezone.utc)
+        since_date = self.get_last_sync(workspace) if incremental else None
+        if incremental:
+            last_sync = since_date.isoformat() if since_date else "never"
+            self.logger.info(f"📅 {workspace} last synced: {last_sync}")
+
+        # External → Hub
+        workspace_results["external_to_hub"] = self.sync_external_to_hub(
+            workspace, since_date=since_date, sync_content=sync_content
         )
 
-        # Fallback to full sync since Notion's last_edited_time isn't filterable
-        return self.sync_full(sync_content=sync_content)
+        # Hub → External
+        workspace_results["hub_to_external"] = self.sync_hub_to_external(
+            workspace, since_date=since_date, sync_content=sync_content
+        )
+
+        # Only advance the watermark after a clean pass, so failed tasks retry
+        if not any(stats["errors"] for stats in workspace_results.values()):
+            self.set_last_sync(workspace, sync_started_at)
+
+        return workspace_results
+
+    def sync_incremental(self, sync_content: bool = False) -> Dict[str, Any]:
+        """Perform incremental sync of tasks edited since the last clean sync."""
+        return self.sync_full(sync_content=sync_content, incremental=True)
 
 
 def main():
@@ -1069,7 +1336,8 @@ def main():
         "--mode",
         choices=["full", "incremental", "test"],
         required=True,
-        help="Sync mode: full (all tasks), incremental (last 24h), test (dry run)",
+        help="Sync mode: full (all tasks), incremental (changed since last sync), "
+        "test (dry run)",
     )
     parser.add_argument(
         "--sync-content",
@@ -1106,6 +1374,8 @@ def main():
                 f"  External → Hub: {ext_to_hub.get('created', 0)} created, {ext_to_hub.get('updated', 0)} updated"
             )
             print(f"  Hub → External: {hub_to_ext.get('updated', 0)} updated")
+            if hub_to_ext.get("missing", 0) > 0:
+                print(f"  ⚠️  Linked pages missing: {hub_to_ext['missing']}")
 
             workspace_errors = ext_to_hub.get("errors", 0) + hub_to_ext.get("errors", 0)
             total_errors += workspace_errors
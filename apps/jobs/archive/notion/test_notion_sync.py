@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for the Notion hub ↔ workspace sync watermarks.
+
+Queries are stubbed on the instance, so nothing here talks to Notion.
+"""
+
+import os
+
+import httpx
+import pytest
+
+import notion_sync
+from notion_sync import NotionTaskSync, RateLimitedClient
+
+
+@pytest.fixture
+def sync(tmp_path, monkeypatch):
+    """A sync client built by the real __init__, with its queries stubbed.
+
+    The environment holds the hub and one external workspace; creating the
+    Notion clients makes no network calls.
+    """
+    monkeypatch.chdir(tmp_path)  # Keep a developer's .env out of the test
+    for key in list(os.environ):
+        if key.endswith("_NOTION_DB_ID"):
+            monkeypatch.delenv(key)
+    monkeypatch.setenv("HUB_NOTION_API_KEY", "hub-token")
+    monkeypatch.setenv("HUB_NOTION_DB_ID", "hub-db")
+    monkeypatch.setenv("HUB_NOTION_USER_ID", "hub-user")
+    monkeypatch.setenv("LIVEPEER_NOTION_API_KEY", "ext-token")
+    monkeypatch.setenv("LIVEPEER_NOTION_DB_ID", "ext-db")
+    monkeypatch.setenv("LIVEPEER_NOTION_USER_ID", "ext-user")
+    monkeypatch.setenv("NOTION_SYNC_STATE_PATH", str(tmp_path / "state.json"))
+    client = NotionTaskSync()
+    client.query_hub_tasks = lambda workspace=None, since_date=None: []
+    client.query_workspace_tasks = lambda *args, **kwargs: []
+    return client
+
+
+def fail(*args, **kwargs):
+    raise RuntimeError("Notion down")
+
+
+def hub_task(external_notion_id=None):
+    """Return a hub task, already in extract_task_data's shape."""
+    return {
+        "id": "hub-1",
+        "task_name": "Ship it",
+        "external_notion_id": external_notion_id,
+        "updated_at": "2026-01-02T00:00:00.000Z",
+    }
+
+
+def test_clean_sync_advances_watermark(sync, tmp_path):
+    """A pass without errors records the workspace's last sync."""
+    results = sync.sync_full()
+
+    assert results["workspaces"]["LIVEPEER"]["external_to_hub"]["errors"] == 0
+    assert sync.get_last_sync("LIVEPEER") is not None
+    assert (tmp_path / "state.json").exists()
+
+
+@pytest.mark.parametrize("failing_query", ["query_hub_tasks", "query_workspace_tasks"])
+def test_query_failure_holds_watermark(sync, failing_query):
+    """A failed query is an error, not an empty database."""
+    setattr(sync, failing_query, fail)
+
+    results = sync.sync_full()
+
+    workspace_results = results["workspaces"]["LIVEPEER"]
+    assert sum(stats["errors"] for stats in workspace_results.values()) == 2
+    assert sync.get_last_sync("LIVEPEER") is None
+
+
+def test_missing_linked_page_advances_watermark(sync):
+    """A deleted external page is reported, but doesn't block every later run."""
+    sync.query_hub_tasks = lambda workspace=None, since_date=None: [hub_task("gone")]
+    sync.extract_task_data = lambda page: page
+
+    results = sync.sync_full()
+
+    hub_to_external = results["workspaces"]["LIVEPEER"]["hub_to_external"]
+    assert hub_to_external["missing"] == 1
+    assert hub_to_external["errors"] == 0
+    assert sync.get_last_sync("LIVEPEER") is not None
+
+
+def test_failed_link_back_counts_as_error(sync):
+    """A created page the hub task can't be linked to is an error."""
+    sync.query_hub_tasks = lambda workspace=None, since_date=None: [hub_task()]
+    sync.extract_task_data = lambda page: page
+    sync.create_task_in_external_workspace = lambda *args: "ext-new"
+    sync.update_task_properties = lambda *args: False
+
+    results = sync.sync_full()
+
+    hub_to_external = results["workspaces"]["LIVEPEER"]["hub_to_external"]
+    assert hub_to_external["errors"] == 1
+    assert hub_to_external["updated"] == 0
+    assert sync.get_last_sync("LIVEPEER") is None
+
+
+def test_rate_limited_request_waits_for_retry_after(monkeypatch):
+    """A 429 is retried once Notion's Retry-After delay has passed."""
+    responses = [
+        httpx.Response(
+            429,
+            headers={"Retry-After": "2"},
+            json={
+                "object": "error",
+                "status": 429,
+                "code": "rate_limited",
+                "message": "slow",
+            },
+        ),
+        httpx.Response(200, json={"object": "page", "id": "p1"}),
+    ]
+    sent = []
+
+    def handle(request):
+        sent.append(request)
+        return responses[len(sent) - 1]
+
+    waits = []
+    monkeypatch.setattr(notion_sync.time, "sleep", waits.append)
+    client = RateLimitedClient(
+        rate_limit=1000,
+        auth="token",
+        client=httpx.Client(transport=httpx.MockTransport(handle)),
+    )
+
+    page = client.pages.retrieve(page_id="p1")
+
+    assert page["id"] == "p1"
+    assert len(sent) == 2
+    assert 2.0 in waits